@@ -439,4 +439,5 @@ def clear():
     finder.Find.clear()
     sit.clear_aliases()
     sit.clear_contexts()
+    common.clear_interned_hierarchies()
     registry.reset_asset_classes()
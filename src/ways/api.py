@@ -73,6 +73,7 @@ from .parsing.registry import register_asset_class
 from .parsing.resource import Asset
 from .parsing.resource import AssetFinder
 from .parsing.resource import get_asset
+from .parsing.resource import get_assets
 from .parsing.tracehelper import trace_method_resolution
 
 add_action_default = Find.add_to_defaults  # pylint: disable=invalid-name
@@ -109,6 +110,7 @@ __all__ = [
 
     'Asset',
     'get_asset',
+    'get_assets',
     'get_asset_class',
     'get_asset_info',
     'register_asset_class',
@@ -11,10 +11,6 @@ TODO:
 '''
 
 
-# IMPORT STANDARD LIBRARIES
-# scspell-id: 3c62e4aa-c280-11e7-be2b-382c4ac59cfd
-import collections
-
 # IMPORT WAYS LIBRARIES
 import ways
 
@@ -35,7 +31,11 @@ class _AssignmentFactory(object):
         '''
         super(_AssignmentFactory, self).__init__()
         self._class_type = class_type
-        self._instances = collections.defaultdict(dict)
+        # Every instance is stored by its (hierarchy, assignment) pair so that
+        # getting an instance is one lookup. A nested defaultdict would need
+        # two and it would also store an empty dict for every missed hierarchy
+        #
+        self._instances = dict()
 
     def get_instance(self, hierarchy, assignment, force=False):
         '''Get an instance of our class if it exists and make it if does not.
@@ -62,7 +62,7 @@ class _AssignmentFactory(object):
 
         # Get our instance, if there is one
         try:
-            return self._instances[hierarchy][assignment]
+            return self._instances[(hierarchy, assignment)]
         except KeyError:
             pass
 
@@ -88,10 +88,10 @@ class _AssignmentFactory(object):
         def make_and_store_instance(hierarchy, assignment):
             '''Create some instance cache it for later, if needed.'''
             instance = self._class_type(hierarchy, assignment=assignment)
-            self._instances[hierarchy][assignment] = instance
+            self._instances[(hierarchy, assignment)] = instance
             return instance
 
-        hierarchy = common.split_hierarchy(hierarchy)
+        hierarchy = common.intern_hierarchy(hierarchy)
 
         # If no plugins were defined or if the plugins are not
         # "not findable" (like an incomplete Context Plugin)
@@ -150,6 +150,7 @@ class _AssignmentFactory(object):
 
         '''
         self._instances.clear()
+        common.clear_interned_hierarchies()
 
 
 class AliasAssignmentFactory(_AssignmentFactory):
@@ -184,15 +185,12 @@ class AliasAssignmentFactory(_AssignmentFactory):
                 The base hierarchy that this alias is meant to represent.
 
         '''
-        current = tuple()
+        current = hierarchy
+        # Aliases can point back to each other so stop once an alias repeats
+        visited = set()
 
-        while current != hierarchy:
-            # On the first run, current will be empty so we just assign it
-            # to a fake hierarchy so that the try/except will not immediately
-            # break
-            #
-            if current == tuple():
-                current = hierarchy
+        while current not in visited:
+            visited.add(current)
 
             # Keep following the aliases until we get to the real hierarchy
             try:
@@ -234,7 +232,7 @@ class AliasAssignmentFactory(_AssignmentFactory):
             # A Context object was passed, by mistake. Just return it again
             return hierarchy
 
-        hierarchy = common.split_hierarchy(hierarchy)
+        hierarchy = common.intern_hierarchy(hierarchy)
 
         instance = super(AliasAssignmentFactory, self).get_instance(
             hierarchy=hierarchy, assignment=assignment, force=force)
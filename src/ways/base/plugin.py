@@ -28,13 +28,9 @@ class PluginRegistry(type):
 
         # TODO : We still need to not be using 'Plugin' ...
         # If we explicitly state not to register a plugin, don't register it
-        # If add_to_registry isn't defined for this Plugin,
-        # assume that we should register it
+        # If add_to_registry isn't defined for this Plugin, don't register it
         #
-        try:
-            if new_class.__name__ == 'Plugin' or not new_class.add_to_registry:
-                return new_class
-        except AttributeError:
+        if new_class.__name__ == 'Plugin' or not getattr(new_class, 'add_to_registry', False):
             return new_class
 
         assignment = get_assignment(new_class)
@@ -51,12 +47,19 @@ class Plugin(object):
     '''An add-on that is later retrieved by Context to gather its data.'''
 
     add_to_registry = True
-    _data = dict()
 
     @property
     def data(self):
         '''dict[str]: The display properties (like {'color': 'red'}).'''
-        return self._data
+        # Plugin subclasses aren't required to call Plugin.__init__ so
+        # the data dict is created the first time that it is needed.
+        # Each instance gets its own dict so that they are not shared
+        #
+        try:
+            return self._data
+        except AttributeError:
+            self._data = dict()
+            return self._data
 
     @data.setter
     def data(self, value):
@@ -101,7 +104,7 @@ class DataPlugin(Plugin):
             ValueError: If there are missing keys in data that this class needs.
 
         '''
-        missing_required_keys = set(self._required_keys()) - set(info.keys())
+        missing_required_keys = set(self._required_keys()).difference(info)
         if missing_required_keys:
             raise ValueError('Info: "{info}" is missing keys, "{keys}".'
                              ''.format(info=info, keys=missing_required_keys))
@@ -110,18 +113,16 @@ class DataPlugin(Plugin):
         # Data is assumed to be a core.classes.dict_class.ReadOnlyDict so we
         # try to unlock it, here. If it's not a custom dict, just let it pass
         #
-        try:
-            is_settable = info.settable
-            info.settable = True
-        except AttributeError:
-            pass
+        if 'uuid' not in info:
+            is_settable = getattr(info, 'settable', None)
 
-        info.setdefault('uuid', str(uuid.uuid4()))
+            if is_settable is not None:
+                info.settable = True
 
-        try:
-            info.settable = is_settable
-        except AttributeError:
-            pass
+            info.setdefault('uuid', str(uuid.uuid4()))
+
+            if is_settable is not None:
+                info.settable = is_settable
 
         self.name = name
         self._info = info
@@ -203,10 +204,10 @@ class DataPlugin(Plugin):
 
     def __repr__(self):
         '''str: The information needed to reproduce this instance.'''
-        return '{cls_}(sources={sources!r}, data={data})'.format(
+        return '{cls_}(sources={sources!r}, data={data!r})'.format(
             cls_=self.__class__.__name__,
             sources=self.sources,
-            data=dict(self._info))
+            data=self._info)
 
     def __str__(self):
         '''str: A more concise print-out of this instance.'''
@@ -218,7 +219,8 @@ class DataPlugin(Plugin):
 
 def get_assignment(obj):
     '''str: Get an object's assignment or fallback to ways.DEFAULT_ASSIGNMENT.'''
-    try:
-        return obj.get_assignment()
-    except AttributeError:
+    get_assignment_ = getattr(obj, 'get_assignment', None)
+    if get_assignment_ is None:
         return common.DEFAULT_ASSIGNMENT
+
+    return get_assignment_()
@@ -51,6 +51,11 @@ class Context(object):
 
     '''A collection of plugins that are read in order to resolve its methods.'''
 
+    # Any character that isn't allowed in a hierarchy
+    _bad_characters_regex = re.compile(r'[^a-zA-Z0-9_\-/ ]+')
+    # The Plugin platform names that mean "every platform"
+    _platform_aliases = frozenset(('*', 'all', 'everything'))
+
     def __init__(self, hierarchy, assignment='', connection=None):
         '''Create the instance and store its location in the Ways hierarchy.
 
@@ -88,9 +93,8 @@ class Context(object):
         hierarchy = common.split_hierarchy(hierarchy)
 
         # Check each term in the hierarchy for bad characters
-        bad_characters_comp = re.compile(r'[^a-zA-Z0-9_\-/ ]+')
         for part in hierarchy:
-            bad_characters = bad_characters_comp.search(part)
+            bad_characters = self._bad_characters_regex.search(part)
 
             if bad_characters:
                 raise ValueError(
@@ -165,10 +169,20 @@ class Context(object):
         plugins = self.get_all_plugins(
             hierarchy=self.hierarchy, assignment=self.assignment)
 
+        if not plugins:
+            return []
+
+        # The platform settings are the same for every plugin so only get them once
+        try:
+            platforms = _get_platform_settings()
+        except OSError:
+            # If the current platform isn't valid, no plugin can be valid
+            return []
+
         output = []
         for plugin in plugins:
             try:
-                self.validate_plugin(plugin)
+                self.validate_plugin(plugin, platforms=platforms)
             except (EnvironmentError, OSError):
                 continue
 
@@ -266,7 +280,7 @@ class Context(object):
         return tokens
 
     @classmethod
-    def validate_plugin(cls, plugin):
+    def validate_plugin(cls, plugin, platforms=None):
         '''Check if a plugin is "valid" for this Context.
 
         Typically, a plugin is invalid if it was meant for a different OS
@@ -275,6 +289,10 @@ class Context(object):
 
         Args:
             plugin (:class:`ways.api.Plugin`): The plugin to check.
+            platforms (:obj:`tuple[set[str], str]`, optional):
+                Every platform that Ways knows about and the platform that
+                Ways is running on, if they were already found.
+                If nothing is given, they're found here.
 
         Raises:
             OSError:
@@ -287,21 +305,12 @@ class Context(object):
             :class:`ways.api.Plugin`: The plugin (completely unmodified).
 
         '''
-        recognized_platforms = ways.get_known_platfoms()
+        if platforms is None:
+            platforms = _get_platform_settings()
 
-        current_platform = get_current_platform()
-
-        if current_platform not in recognized_platforms:
-            system_platform = platform.system().lower()
-            raise OSError(
-                'Found platform: "{platform_}" was invalid. Options were, '
-                '"{opt}". Detected system platform was: "{d_plat}".'
-                ''.format(platform_=current_platform,
-                          opt=recognized_platforms,
-                          d_plat=system_platform))
+        recognized_platforms, current_platform = platforms
 
         # Filter plugins if the its platform does not match our expected platforms
-        platform_aliases = {'*', 'all', 'everything'}
         plug_platforms = common.get_platforms(plugin)
 
         # Prevent a Plugin that has a bad-formatted platform from being filtered
@@ -314,7 +323,7 @@ class Context(object):
         # If the Plugin has some syntax that means "Just use this
         # for every platform" then add the plugin to output_plugins
         #
-        use_all_platforms = platform_aliases & plug_platforms
+        use_all_platforms = cls._platform_aliases & plug_platforms
         if use_all_platforms:
             plug_platforms = recognized_platforms
 
@@ -380,18 +389,15 @@ class Context(object):
 
     def is_path(self):
         '''bool: If the user indicated that the given mapping is a filepath.'''
-        for plugin in reversed(self.plugins):
-            value = plugin.is_path()
-            if value is not None:
-                return value
-
-        return False
+        return _is_path(self.plugins)
 
     def get_mapping(self):
         '''str: The mapping that describes this Context.'''
-        mapping = self.connection['get_mapping'](self.plugins)
+        # Finding plugins is expensive so only do it once
+        plugins = self.plugins
+        mapping = self.connection['get_mapping'](plugins)
 
-        if self.is_path():
+        if _is_path(plugins):
             # TODO : Make a good function here to check if a \ is "escaped"
             if get_current_platform().lower() == 'windows':
                 mapping = mapping.replace('/', '\\')
@@ -454,16 +460,13 @@ def context_connection_info():
         defined in which hierarchies and get the last-defined of each
 
         '''
-        hierarchies = collections.OrderedDict()
-        for plugin in sorted(plugins, key=operator.methodcaller('get_hierarchy')):
-            hierarchies.setdefault(plugin.get_hierarchy(), [])
-            hierarchies[plugin.get_hierarchy()].append(plugin)
-
-        output = []
-        for plugins_ in six.itervalues(hierarchies):
-            output.append(plugins_[-1])
+        # Later plugins replace earlier plugins of the same hierarchy
+        latest_plugins = dict()
+        for plugin in plugins:
+            latest_plugins[plugin.get_hierarchy()] = plugin
 
-        return output
+        # Only the unique hierarchies need to be sorted
+        return [latest_plugins[hierarchy] for hierarchy in sorted(latest_plugins)]
 
     def get_platforms_lowered(obj):
         '''Try to catch formatting issues with platforms by lowering them.
@@ -536,15 +539,19 @@ def context_connection_info():
                 'make sure that the assignment is listed in WAYS_PRIORITY or it '
                 'may have been skipped.')
 
-        try:
-            latest_absolute_plugin = next(
-                plugin for plugin in reversed(plugins) if not plugin.get_uses())
-        except StopIteration:
+        # Find the latest absolute plugin and its index in one backwards pass
+        abs_index = None
+        for index in moves.range(len(plugins) - 1, -1, -1):
+            if not plugins[index].get_uses():
+                abs_index = index
+                break
+
+        if abs_index is None:
             raise RuntimeError('This should not happen. Every plugin found was '
                                'a relative plugin. No absolute (root) plugin '
                                'was found.')
 
-        abs_index = plugins.index(latest_absolute_plugin)
+        latest_absolute_plugin = plugins[abs_index]
 
         # In order to resolve the absolute mapping, we need a root path to use
         base_mapping = conn.get_right_most_priority(
@@ -613,28 +620,32 @@ def context_connection_info():
             return True
 
         max_folders = []
+        # The split of max_folders[-1], so that it's only split once
+        recent_max = None
         for plugin in plugins:
             plugin_max_folder = plugin.get_max_folder()
             if not plugin_max_folder:
                 continue
-            if not max_folders:
-                max_folders.append(plugin_max_folder)
-                continue
 
-            recent_max_folder = max_folders[-1]
             # To deal with poorly formatted folder input, we normalize the
             # paths and then split them by '/' and '\' before comparing them
             #
             plugin_max = pathrip.split_path_asunder(os.path.normcase(plugin_max_folder))
-            recent_max = pathrip.split_path_asunder(os.path.normcase(recent_max_folder))
+
+            if not max_folders:
+                max_folders.append(plugin_max_folder)
+                recent_max = plugin_max
+                continue
 
             if startswith_iterable(plugin_max, recent_max):
                 # If the next folder is a more detailed version of the first,
                 # just replace the most recent folder
                 #
                 max_folders[-1] = plugin_max_folder
+                recent_max = plugin_max
             elif max_folders[-1] != plugin_max_folder:
                 max_folders.append(plugin_max_folder)
+                recent_max = plugin_max
 
         # Normalize and return our absolute max-folder path
         joined = ''.join(max_folders)
@@ -748,6 +759,34 @@ def get_current_platform():
     return os.getenv(common.PLATFORM_ENV_VAR, system_platform)
 
 
+def _get_platform_settings():
+    '''Get the platforms that Ways knows about and the platform it's running on.
+
+    Raises:
+        OSError:
+            If the user specified an unrecognized environment using the
+            PLATFORM_ENV_VAR environment variable.
+
+    Returns:
+        tuple[set[str], str]: The recognized platforms and the current platform.
+
+    '''
+    recognized_platforms = ways.get_known_platfoms()
+
+    current_platform = get_current_platform()
+
+    if current_platform not in recognized_platforms:
+        system_platform = platform.system().lower()
+        raise OSError(
+            'Found platform: "{platform_}" was invalid. Options were, '
+            '"{opt}". Detected system platform was: "{d_plat}".'
+            ''.format(platform_=current_platform,
+                      opt=recognized_platforms,
+                      d_plat=system_platform))
+
+    return (recognized_platforms, current_platform)
+
+
 def register_context_alias(alias_hierarchy, old_hierarchy):
     '''Set a hierarchy to track the changes of another hierarchy.
 
@@ -848,3 +887,21 @@ def clear_contexts():
 
     '''
     __FACTORY.clear()
+
+
+def _is_path(plugins):
+    '''Check if the latest Plugin that has an opinion says its mapping is a filepath.
+
+    Args:
+        plugins (list[:class:`ways.api.Plugin`]): The plugins to check.
+
+    Returns:
+        bool: If the mapping of the plugins is a filepath.
+
+    '''
+    for plugin in reversed(plugins):
+        value = plugin.is_path()
+        if value is not None:
+            return value
+
+    return False
@@ -15,6 +15,12 @@ import string
 import functools
 import itertools
 
+# Mapping is imported here, once, for every module in this package that needs it
+try:
+    from collections.abc import Mapping  # pylint: disable=unused-import
+except ImportError:
+    from collections import Mapping  # pylint: disable=ungrouped-imports,unused-import
+
 # IMPORT THIRD-PARTY LIBRARIES
 import six
 
@@ -46,6 +52,12 @@ PARENT_TOKEN = '{root}'
 
 WAYS_UUID_KEY = 'uuid'
 
+# Every hierarchy that was interned, mapped to its split tuple. Equal
+# hierarchies share the same tuple object so that the dict lookups that
+# use it as a key can match by identity
+#
+__HIERARCHY_POOL = dict()
+
 
 def expand_string(format_string, obj):
     '''Split a string into a dict using a Python-format string.
@@ -81,7 +93,7 @@ def expand_string(format_string, obj):
     info = dict()
 
     # The string is reversed and processed from end to beginning
-    for prefix, field, _, _ in reversed(list(string.Formatter().parse(format_string))):
+    for prefix, field in _get_reversed_format_fields(format_string):
         if not prefix:
             # We got to the beginning of the formatted str so just return obj
             info[field] = obj
@@ -192,6 +204,43 @@ def split_hierarchy(obj, as_type=tuple):
     return split_into_parts(obj, split=HIERARCHY_SEP, as_type=as_type)
 
 
+def intern_hierarchy(obj):
+    '''Split a hierarchy into a tuple that is shared by every equal hierarchy.
+
+    Each hierarchy is only split once. Call clear_interned_hierarchies
+    to forget every hierarchy that was split.
+
+    Args:
+        obj (str or tuple[str]): The hierarchy to split.
+
+    Returns:
+        tuple[str]: The hierarchy, split into pieces.
+
+    '''
+    try:
+        return __HIERARCHY_POOL[obj]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable hierarchies (like lists) can't be stored
+        return intern_hierarchy(split_hierarchy(obj))
+
+    hierarchy = split_hierarchy(obj)
+
+    # A str and a tuple of the same hierarchy split into equal tuples
+    # so store the first one and return it for both of them
+    #
+    hierarchy = __HIERARCHY_POOL.setdefault(hierarchy, hierarchy)
+    __HIERARCHY_POOL[obj] = hierarchy
+
+    return hierarchy
+
+
+def clear_interned_hierarchies():
+    '''Remove every hierarchy that was stored by intern_hierarchy.'''
+    __HIERARCHY_POOL.clear()
+
+
 # pylint: disable=invalid-name
 split_by_comma = functools.partial(split_into_parts, split=',')
 
@@ -234,6 +283,23 @@ def memoize(function):
     return wrapper
 
 
+@memoize
+def _get_reversed_format_fields(format_string):
+    '''Split a Python-format string into its text and field names, once.
+
+    Args:
+        format_string (str): The Python-format style string to split.
+
+    Returns:
+        tuple[tuple[str, str]]:
+            The text before each field and the field's name, starting from
+            the end of format_string.
+
+    '''
+    return tuple((prefix, field) for prefix, field, _, _
+                 in reversed(list(string.Formatter().parse(format_string))))
+
+
 def decode(obj):
     '''dict[str]: Convert a URL-encoded string back into a dict.'''
     return conform_decode(six.moves.urllib.parse.parse_qs(obj))
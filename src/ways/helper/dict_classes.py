@@ -6,8 +6,11 @@
 # IMPORT STANDARD LIBRARIES
 import collections
 
+# IMPORT LOCAL LIBRARIES
+from . import common
 
-class ReadOnlyDict(collections.Mapping, object):
+
+class ReadOnlyDict(common.Mapping, object):
 
     '''A dictionary whose items can be set to read-only, if need be.'''
 
@@ -61,6 +64,10 @@ class ReadOnlyDict(collections.Mapping, object):
         '''int: The number of items in this instance.'''
         return len(self._data)
 
+    def __repr__(self):
+        '''str: The stored information, printed like a regular dict.'''
+        return repr(self._data)
+
     def __unsettable_error_message(self):
         '''Raise a message letting us know that we cannot set this class.'''
         raise RuntimeError('Object: "{obj!r}" is in read-only mode and '
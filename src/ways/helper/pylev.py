@@ -177,6 +177,23 @@ def wfi_levenshtein(string_1, string_2):
     len_1 = len(string_1)
     len_2 = len(string_2)
 
+    # A shared prefix or suffix never changes the distance so strip it,
+    # to shrink the matrix. Paths tend to share a lot of their characters
+    #
+    start = 0
+    shortest = min(len_1, len_2)
+    while start < shortest and string_1[start] == string_2[start]:
+        start += 1
+
+    while len_1 > start and len_2 > start and string_1[len_1 - 1] == string_2[len_2 - 1]:
+        len_1 -= 1
+        len_2 -= 1
+
+    string_1 = string_1[start:len_1]
+    string_2 = string_2[start:len_2]
+    len_1 -= start
+    len_2 -= start
+
     if len_1 == 0:
         return len_2
     if len_2 == 0:
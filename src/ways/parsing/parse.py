@@ -7,10 +7,10 @@
 import os
 import re
 import itertools
-import collections
 
 # IMPORT LOCAL LIBRARIES
 from ..core import check
+from ..helper import common
 from ..parsing import engine
 
 ENCLOSURE_TOKEN_REGEX = r'(\{[^\{\}]+\})'
@@ -43,8 +43,9 @@ class ContextParser(object):
         super(ContextParser, self).__init__()
         self.context = context
         self._data = dict()
+        self._details = None
 
-    def is_valid(self, token, value, resolve_with='regex'):
+    def is_valid(self, token, value, resolve_with='regex', details=None):
         '''Check if a given value will work for some Ways token.
 
         Args:
@@ -55,6 +56,9 @@ class ContextParser(object):
             resolve_with (:obj:`str`, optional):
                 The parse type to use to check if value is valid for token.
                 Only 'regex' is supported right now. Default: 'regex'.
+            details (:obj:`dict[str]`, optional):
+                The combined mapping details of this parser, if they were
+                already computed. If nothing is given, they're computed here.
 
         Returns:
             bool:
@@ -65,9 +69,11 @@ class ContextParser(object):
         if resolve_with != 'regex':
             raise NotImplementedError('This is not supported yet')
 
-        mapping_details = self.get_all_mapping_details()
+        if details is None:
+            details = self.get_all_mapping_details()
+
         try:
-            info = mapping_details[token]
+            info = details[token]
         except KeyError:
             return True
 
@@ -169,7 +175,7 @@ class ContextParser(object):
 
         return mapping
 
-    def get_tokens(self, required_only=False):
+    def get_tokens(self, required_only=False, details=None):
         '''Get the tokens in this instance.
 
         Args:
@@ -177,15 +183,21 @@ class ContextParser(object):
                 If True, do not return optional tokens.
                 If False, return all tokens, required and optional.
                 Default is False.
+            details (:obj:`dict[str]`, optional):
+                The combined mapping details of this parser, if they were
+                already computed. If nothing is given, they're computed here.
 
         Returns:
             list[str]: The requested tokens.
 
         '''
         if required_only:
-            return self.get_required_tokens()
+            return self.get_required_tokens(details=details)
+
+        if details is None:
+            details = self.get_all_mapping_details()
 
-        return list(self.get_all_mapping_details().keys())
+        return list(details.keys())
 
     def get_child_tokens(self, token):
         '''Find the child tokens of a given token.
@@ -210,16 +222,26 @@ class ContextParser(object):
 
         return []
 
-    def get_required_tokens(self):
-        '''list[str]: Get the tokens for this Context that must be filled.'''
-        full_mapping_details = self.get_all_mapping_details()
-        required_tokens = []
+    def get_required_tokens(self, details=None):
+        '''Get the tokens for this Context that must be filled.
 
-        for key, info in full_mapping_details.items():
-            if info.get('required', True) and key not in required_tokens:
-                required_tokens.append(key)
+        Args:
+            details (:obj:`dict[str]`, optional):
+                The combined mapping details of this parser, if they were
+                already computed. If nothing is given, they're computed here.
 
-        return required_tokens
+        Returns:
+            list[str]: The required tokens.
+
+        '''
+        if details is None:
+            details = self.get_all_mapping_details()
+
+        # The keys of a dict are already unique so there's no need
+        # to check if a token was added already
+        #
+        return [key for key, info in details.items()
+                if info.get('required', True)]
 
     def get_all_mapping_details(self):
         '''Get the combined mapping details of this Context.
@@ -231,14 +253,24 @@ class ContextParser(object):
             Context.get_mapping_details() with all of its plugin's data.
             Use with caution.
 
+            The details are only combined once, the first time that this
+            method is called. Context.get_parser makes a new parser on
+            every call so get a new parser if the Context's plugins change.
+
         Returns:
             dict[str]: The combined mapping_details of our Context and plugins.
 
         '''
+        if self._details is not None:
+            return self._details
+
         contents = dict()
 
         for mapping_details in self.get_mapping_details():
             contents.update(mapping_details)
+
+        self._details = contents
+
         return contents
 
     def get_mapping_details(self):
@@ -338,7 +370,7 @@ class ContextParser(object):
 
         if groups is None:
             groups = dict()
-        elif not isinstance(groups, collections.Mapping):
+        elif not isinstance(groups, common.Mapping):
             try:
                 groups = {key: value for key, value in groups}
             except TypeError:
@@ -440,6 +472,15 @@ class ContextParser(object):
         '''Set the value of some key on this instance.'''
         self._data[key] = value
 
+    def update(self, info):
+        '''Set the values of many keys on this instance at once.
+
+        Args:
+            info (dict[str]): The token-value pairs to store.
+
+        '''
+        self._data.update(info)
+
     def __contains__(self, other):
         '''Check if a token is in this instance.'''
         return other in self._data
@@ -29,6 +29,11 @@ from ..base import situation as sit
 
 ASSET_FACTORY = dict()
 
+# The resolved (class, init) pair of every hierarchy that was queried.
+# This cache must be cleared whenever ASSET_FACTORY changes
+#
+__ASSET_INFO_CACHE = dict()
+
 
 def get_asset_class(hierarchy):
     '''Get the class that is registered for a Context hierarchy.'''
@@ -47,28 +52,33 @@ def get_asset_info(hierarchy):
             The class type and the function that is used to instantiate it.
 
     '''
+    hierarchy = tuple(hierarchy)
+
+    try:
+        return __ASSET_INFO_CACHE[hierarchy]
+    except KeyError:
+        pass
+
     class_type = None
     init = None
 
     # Try to find a class type from one of our parent hierarchies
     for index in reversed(range(len(hierarchy) + 1)):
-        hierarchy_piece = tuple(hierarchy[:index])
+        hierarchy_piece = hierarchy[:index]
 
-        hierarchy_info = ASSET_FACTORY.get(hierarchy_piece, dict())
-
-        try:
-            class_type_ = ASSET_FACTORY[hierarchy_piece]['class']
-            init_ = ASSET_FACTORY[hierarchy_piece]['init']
-        except KeyError:
+        # Hierarchies that were never registered (or that were reset
+        # by reset_asset_classes) have no information. Skip them
+        #
+        hierarchy_info = ASSET_FACTORY.get(hierarchy_piece)
+        if not hierarchy_info:
             continue
 
         if hierarchy_piece == hierarchy or hierarchy_info.get('children', False):
-            class_type = class_type_
-            init = init_
+            class_type = hierarchy_info['class']
+            init = hierarchy_info['init']
             break
 
-    if class_type is None:
-        return (None, None)
+    __ASSET_INFO_CACHE[hierarchy] = (class_type, init)
 
     return (class_type, init)
 
@@ -86,6 +96,8 @@ def register_asset_class(class_type, context, init=None, children=False):
             The Context to apply our new class to.
         init (:obj:`callable`, optional):
             A function that will be used to create an instance of class_type.
+            It is called with the same arguments as class_type. If no init
+            is given, class_type is called directly.
             This variable is useful if you need to customize your class_type's
             __init__ in a way that isn't normal (A common example: If you want
             to create a class_type that does not pass context into its __init__,
@@ -97,18 +109,30 @@ def register_asset_class(class_type, context, init=None, children=False):
 
     '''
     if not init:
-        init = make_default_init(class_type)
+        # Calling the class directly is the same as calling a
+        # partial of it, just without the extra wrapper
+        #
+        init = class_type
 
     context = sit.get_context(context, force=True)
+    __ASSET_INFO_CACHE.clear()
 
-    ASSET_FACTORY[context.get_hierarchy()] = dict()
-    ASSET_FACTORY[context.get_hierarchy()]['class'] = class_type
-    ASSET_FACTORY[context.get_hierarchy()]['init'] = init
-    ASSET_FACTORY[context.get_hierarchy()]['children'] = children
+    ASSET_FACTORY[tuple(context.get_hierarchy())] = {
+        'class': class_type,
+        'init': init,
+        'children': children,
+    }
 
 
 def make_default_init(class_type, *args, **kwargs):
-    '''Just make the class type, normally.'''
+    '''Just make the class type, normally.
+
+    Note:
+        register_asset_class no longer needs this function. If no init is
+        given, class_type is called directly. This function is only kept
+        so that existing code that calls it still works.
+
+    '''
     return functools.partial(class_type, *args, **kwargs)
 
 
@@ -121,12 +145,16 @@ def reset_asset_classes(hierarchies=tuple()):
             If nothing is given, all hierarchies will be cleared.
 
     '''
+    __ASSET_INFO_CACHE.clear()
+
     if not hierarchies:
-        hierarchies = ASSET_FACTORY.keys()
+        hierarchies = list(ASSET_FACTORY.keys())
 
     for key in hierarchies:
-        if key not in ASSET_FACTORY:
+        info = ASSET_FACTORY.get(key)
+
+        if info is None:
             continue
 
         # Reset the key
-        ASSET_FACTORY[key] = ASSET_FACTORY[key].__class__()
+        ASSET_FACTORY[key] = info.__class__()
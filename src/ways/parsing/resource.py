@@ -13,7 +13,7 @@ cannot carry instance data.
 # scspell-id: 3c62e4aa-c280-11e7-be2b-382c4ac59cfd
 import os
 import re
-import ast
+import operator
 import functools
 import itertools
 import collections
@@ -25,16 +25,17 @@ import six
 import ways
 
 # IMPORT LOCAL LIBRARIES
+from . import parse
 from . import trace
 from . import registry
 from ..base import finder as find
 from ..base import situation as sit
-from ..core import check
 from ..core import compat
 from ..helper import pylev
 from ..helper import common
 
 __DEFAULT_OBJECT = object()
+__TOKEN_ENCLOSURE_REGEX = re.compile('({[^{}]*})')
 
 
 class Asset(object):
@@ -48,6 +49,8 @@ class Asset(object):
 
     '''
 
+    __slots__ = ('parse_type', 'info', 'context', '_actions', '__weakref__')
+
     def __init__(self, info, context, parse_type='regex'):
         '''Create the instance and store its info and Context.
 
@@ -79,7 +82,7 @@ class Asset(object):
 
         self.info = info
         self.context = context
-        self.actions = AssetFinder(finder=find.Find(self.context), asset=self)
+        self._actions = None
 
         missing_tokens = self.get_missing_required_tokens()
         if missing_tokens:
@@ -88,6 +91,47 @@ class Asset(object):
                 'Info is missing tokens, "{keys}"'.format(
                     info=self.info, context=self.context, keys=missing_tokens))
 
+    @property
+    def actions(self):
+        ''':class:`AssetFinder`: The Actions of this Asset's Context.
+
+        The Actions are only looked up once they're needed. Many Asset
+        objects are created (for example, while searching for a Context)
+        and most of them never use their Actions.
+
+        '''
+        if self._actions is None:
+            self._actions = AssetFinder(finder=find.Find(self.context), asset=self)
+
+        return self._actions
+
+    @actions.setter
+    def actions(self, value):
+        '''Replace this Asset's Actions.
+
+        Args:
+            value (:class:`AssetFinder`): The object to get Actions from.
+
+        '''
+        self._actions = value
+
+    def _get_filled_parser(self):
+        '''Create a parser for this Asset's Context, filled with our info.
+
+        Note:
+            A new parser is returned on every call. Searching for a token's
+            value can add values to the parser so it must not be shared
+            between calls.
+
+        Returns:
+            :class:`ways.api.ContextParser`: The filled parser.
+
+        '''
+        parser = self.context.get_parser()
+        parser.update(self.info)
+
+        return parser
+
     def get_missing_required_tokens(self):
         '''Find any token that still needs to be filled for our parser.
 
@@ -121,24 +165,31 @@ class Asset(object):
             str: The resolved string for this instance.
 
         '''
-        parser = self.context.get_parser()
+        parser = self._get_filled_parser()
 
-        for key, value in six.iteritems(self.info):
-            parser[key] = value
+        if required:
+            # Every token is searched using the same mapping details
+            # so only get them once
+            #
+            details = parser.get_all_mapping_details()
+            missing_required_tokens = []
 
-        unfilled_tokens = []
-        for token in self.get_unfilled_tokens():
-            value = self.get_value(token)
-            if not value:
-                unfilled_tokens.append(token)
+            # Only required tokens can fail so don't search for the others
+            unfilled_tokens = [token for token in parser.get_required_tokens(details=details)
+                               if token not in self.info]
 
-        required_tokens = parser.get_required_tokens()
-        missing_required_tokens = set(required_tokens) & set(unfilled_tokens)
+            for token in unfilled_tokens:
+                # Searching for a value can add values to a parser
+                # so each token must get its own parser
+                #
+                value = self._get_value(token, self._get_filled_parser())
+                if not _run_before_return(token, value, details):
+                    missing_required_tokens.append(token)
 
-        if required and missing_required_tokens:
-            raise ValueError('Required tokens: "{tokens}" must be filled. '
-                             'Cannot retrieve path.'.format(
-                                 tokens=sorted(missing_required_tokens)))
+            if missing_required_tokens:
+                raise ValueError('Required tokens: "{tokens}" must be filled. '
+                                 'Cannot retrieve path.'.format(
+                                     tokens=sorted(missing_required_tokens)))
 
         return parser.get_str(*args, **kwargs)
 
@@ -220,44 +271,14 @@ class Asset(object):
         # Create a parser and fill it up with all of the info we can
         # so that we can use it using Parent-Search and Child-Search
         #
-        parser = self.context.get_parser()
-        for key, value in six.iteritems(self.info):
-            parser[key] = value
-
-        details = parser.get_all_mapping_details()
+        parser = self._get_filled_parser()
         value = self._get_value(name, parser)
 
         if real:
             return value
 
         # Modify the value before it is returned to the user, if they say to
-        before_return = check.force_itertype(
-            details.get(name, dict()).get('before_return', []))
-
-        for function in before_return:
-            # TODO : change with something better
-            try:
-                function = common.import_object(function)
-            except ImportError:
-                pass
-            else:
-                value = function(value)
-                continue
-
-            try:
-                value = ast.literal_eval(
-                    '{function}({value})'.format(function=function, value=value))
-                # literal_eval will raise ValueError if the string has syntax errors
-            except (ValueError, NameError):
-                try:
-                    # TODO : Remove this eval
-                    # pylint: disable=eval-used
-                    value = eval('{function}({value})'.format(function=function, value=value))
-                except NameError:
-                    # NameError will happen if the function is not importable
-                    raise ValueError('Function: "{func}" could not be run'.format(func=function))
-
-        return value
+        return _run_before_return(name, value, parser.get_all_mapping_details())
 
     def _get_value(self, name, parser):
         '''Get some information about this asset, using a token-name.
@@ -315,6 +336,9 @@ class Asset(object):
 
     def __eq__(self, other):
         '''bool: If the two Asset objects have the same data stored.'''
+        if other is self:
+            return True
+
         return isinstance(other, self.__class__) and self.info == other.info
 
     def __repr__(self):
@@ -375,23 +399,6 @@ class AssetFinder(compat.DirMixIn, object):
             callable: The function for the given name.
 
         '''
-        def add_asset_info_to_function(func, asset):
-            '''Pass the given asset to our original function.
-
-            Args:
-                func (callable):
-                    The function to call. It must take at least one arg and
-                    the first arg must take an Asset object.
-
-            '''
-            def function(*args, **kwargs):
-                '''Run the original function but with an Asset added to it.'''
-                return func(asset, *args, **kwargs)
-
-            function.__doc__ = func.__doc__
-
-            return function
-
         function = self.finder.__getattr__(name)
 
         # Finder returns a functools.partial. So we'll unpack it by getting
@@ -399,18 +406,23 @@ class AssetFinder(compat.DirMixIn, object):
         #
         function = function.func
 
-        return add_asset_info_to_function(func=function, asset=self._asset)
+        # Note: The partial isn't stored on this instance because the actions
+        #       of a Context can change after the Asset is created
+        #
+        asset_function = functools.partial(function, self._asset)
+        asset_function.__doc__ = function.__doc__
+
+        return asset_function
 
     def __dir__(self):
         '''list[str]: Add Action names to the list of return items.'''
         return sorted(
             set(itertools.chain(
-                self.__dict__.keys(),
                 trace.trace_action_names(self.finder.context),
                 super(AssetFinder, self).__dir__())))
 
 
-def _expand_using_context(context, text, choices=None, default=__DEFAULT_OBJECT):
+def _expand_using_context(context, text, choices=None, default=__DEFAULT_OBJECT, patterns=None):
     '''Expand some text into a dictionary of information, using a Context.
 
     Args:
@@ -425,6 +437,11 @@ def _expand_using_context(context, text, choices=None, default=__DEFAULT_OBJECT)
             are given for you.
         default:
             The object to return if nothing is found.
+        patterns (:obj:`dict[str: str]`, optional):
+            The Context's parse patterns, for each parse type. Any pattern
+            that is missing is created and then added to this dict so that
+            other calls can reuse it. If nothing is given, every pattern
+            is created from scratch.
 
     Returns:
         dict or default:
@@ -435,25 +452,28 @@ def _expand_using_context(context, text, choices=None, default=__DEFAULT_OBJECT)
     '''
     order = _get_expand_order()
 
+    if patterns is None:
+        patterns = dict()
+
     if choices is None:
         choices = _get_expand_choices()
 
     if default == __DEFAULT_OBJECT:
         default = dict()
 
-    # TODO : register these keys/values as plugins or something?
-    pattern_getter = collections.OrderedDict()
-    pattern_getter['default'] = functools.partial(context.get_str, display_tokens=True)
-    pattern_getter['regex'] = functools.partial(
-        context.get_str, resolve_with=('regex', ), display_tokens=True)
+    pattern_getters = _get_pattern_getters()
 
     for key in order:
-        getter = pattern_getter.get(key, lambda: None)
-        pattern = getter()
+        try:
+            pattern = patterns[key]
+        except KeyError:
+            getter = pattern_getters.get(key)
+            pattern = getter(context) if getter else None
+            patterns[key] = pattern
 
         if pattern:
             value = _expand_using_parse_types(
-                parse=pattern, text=text, choices=choices, default=default)
+                pattern=pattern, text=text, choices=choices, default=default, order=order)
 
             if value:
                 return value
@@ -461,15 +481,15 @@ def _expand_using_context(context, text, choices=None, default=__DEFAULT_OBJECT)
     return default
 
 
-def _expand_using_parse_types(parse, text, choices=None, default=__DEFAULT_OBJECT):
+def _expand_using_parse_types(pattern, text, choices=None, default=__DEFAULT_OBJECT, order=None):
     '''Expand some text, using a parse string of some kind.
 
     We say "some kind" because the parse string could be a Python format string
     or a regex pattern, for example.
 
     Args:
-        context (:class:`ways.api.Context`):
-            The Context to get parse text for and then use.
+        pattern (str):
+            The parse string to use to expand text.
         text (str):
             The text to expand.
         choices (:obj:`dict[str: callable]`, optional):
@@ -478,6 +498,9 @@ def _expand_using_parse_types(parse, text, choices=None, default=__DEFAULT_OBJEC
             are given, some default choices are given for you.
         default:
             The object to return if nothing is found.
+        order (:obj:`list[str]`, optional):
+            The parse types to try, in order. If no order is given,
+            the order is read from the current environment.
 
     Returns:
         dict or default:
@@ -486,7 +509,7 @@ def _expand_using_parse_types(parse, text, choices=None, default=__DEFAULT_OBJEC
             it returns whatever the default value was.
 
     '''
-    order = _get_expand_order()
+    order = _get_expand_order(order)
 
     if choices is None:
         choices = _get_expand_choices()
@@ -495,17 +518,34 @@ def _expand_using_parse_types(parse, text, choices=None, default=__DEFAULT_OBJEC
         default = dict()
 
     for choice in order:
-        value = choices[choice](parse, text)
+        value = choices[choice](pattern, text)
 
         if value:
-            break
+            return value
 
-    if not value:
-        value = default
+    return default
 
-    return value
 
+@common.memoize
+def _get_pattern_getters():
+    '''Get the functions that create a Context's pattern for each parse type.
 
+    Returns:
+        :class:`collections.OrderedDict` [str: callable]:
+            The parse type and a function that takes a Context and returns
+            its pattern.
+
+    '''
+    # TODO : register these keys/values as plugins or something?
+    pattern_getters = collections.OrderedDict()
+    pattern_getters['default'] = operator.methodcaller('get_str', display_tokens=True)
+    pattern_getters['regex'] = operator.methodcaller(
+        'get_str', resolve_with=('regex', ), display_tokens=True)
+
+    return pattern_getters
+
+
+@common.memoize
 def _get_expand_choices():
     '''Get a description of each registered parse type and how it creates a dict.
 
@@ -521,20 +561,105 @@ def _get_expand_choices():
     '''
     # TODO : Make an abstract registry for "expansion" parse_types ?
     choices = collections.OrderedDict()
+    choices['default'] = common.expand_string
+    choices['regex'] = _regex_groupdict
+
+    return choices
 
-    def regex_groupdict(pattern, text):
-        '''Get a dictionary of named keys for each text match, in pattern.'''
-        match = re.match(pattern, text)
 
-        try:
-            return match.groupdict()
-        except AttributeError:
-            return dict()
+@common.memoize
+def _compile_regex(pattern):
+    '''Compile a regex pattern once and reuse it for every other call.
 
-    choices['default'] = common.expand_string
-    choices['regex'] = regex_groupdict
+    Args:
+        pattern (str): The regex pattern to compile.
 
-    return choices
+    Returns:
+        :class:`re.RegexObject`: The compiled pattern.
+
+    '''
+    return re.compile(pattern)
+
+
+def _regex_groupdict(pattern, text):
+    '''Get a dictionary of named keys for each text match, in pattern.'''
+    match = _compile_regex(pattern).match(text)
+
+    # Most Contexts don't match when searching for one, so check for
+    # it directly instead of catching an AttributeError
+    #
+    if match is None:
+        return dict()
+
+    return match.groupdict()
+
+
+@common.memoize
+def _remove_tokens(mapping):
+    '''str: Remove every {TOKEN} from a mapping. Each mapping is only processed once.'''
+    return __TOKEN_ENCLOSURE_REGEX.sub('', mapping)
+
+
+@common.memoize
+def _find_tokens(mapping):
+    '''tuple[str]: The tokens inside of a mapping. Each mapping is only searched once.'''
+    return tuple(parse.find_tokens(mapping))
+
+
+def _run_before_return(name, value, details):
+    '''Modify a token's value with its "before_return" functions, if it has any.
+
+    Args:
+        name (str):
+            The token that value was found for.
+        value:
+            The value to modify.
+        details (dict[str]):
+            The combined mapping details that define name's functions.
+
+    Returns:
+        The modified value. If name has no functions, value is returned as-is.
+
+    '''
+    try:
+        before_return = details[name]['before_return']
+    except KeyError:
+        return value
+
+    if isinstance(before_return, six.string_types):
+        before_return = (before_return, )
+
+    for function in before_return:
+        value = _resolve_callable(function)(value)
+
+    return value
+
+
+@common.memoize
+def _resolve_callable(name):  # pylint: disable=inconsistent-return-statements
+    '''Find the function that a "before_return" name refers to.
+
+    Args:
+        name (str):
+            An importable name (Example: 'ways.helper.common.get_platforms')
+            or the name of a builtin function (Example: 'int').
+
+    Raises:
+        ValueError: If name could not be resolved to any object.
+
+    Returns:
+        callable: The found function.
+
+    '''
+    try:
+        return common.import_object(name)
+    except ImportError:
+        pass
+
+    try:
+        return getattr(six.moves.builtins, name)
+    except AttributeError as err:
+        six.raise_from(ValueError('Function: "{func}" could not be run'.format(func=name)), err)
 
 
 def _get_expand_order(order=None):
@@ -586,29 +711,77 @@ def _get_recursive_parents(token, parser):
         list[str]: The found parent tokens.
 
     '''
-    def _yield_parent_details(token, parser, details):
-        '''Yield parent tokens for a given token, by looking at a token's details.
+    details = parser.get_all_mapping_details()
 
-        This function exists just so that we don't have to call
-        parser.get_all_mapping_details() for each iteration. This makes the
-        call slightly more efficient.
+    # Find the direct parents of every token, once. Otherwise, we'd need
+    # to call parser.get_child_tokens for every parent of every parent.
+    # The child tokens are read from details, the same way that
+    # get_child_tokens does, so that details aren't rebuilt for each parent
+    #
+    direct_parents = dict()
+    for parent, info in six.iteritems(details):
+        for child in set(_find_tokens(info.get('mapping', ''))):
+            # A token shouldn't ever be a child of itself so we can skip it
+            if child != parent:
+                direct_parents.setdefault(child, []).append(parent)
+
+    # Walk up the parents, depth-first. Each parent is listed right before
+    # its own parents so that the immediate parent of token is always first
+    #
+    parents = []
+    path = [token]
+    stack = [iter(direct_parents.get(token, []))]
 
-        '''
-        for parent in six.iterkeys(details):
-            if parent == token:
-                # A token shouldn't ever be a child of itself so we can skip it
-                continue
+    while stack:
+        parent = next(stack[-1], None)
 
-            children = parser.get_child_tokens(parent)
+        if parent is None:
+            stack.pop()
+            path.pop()
+            continue
 
-            if token in children:
-                yield parent
+        if parent in path:
+            # The mapping details are cyclic. Don't walk in circles
+            continue
 
-                for parent_ in _yield_parent_details(parent, parser, details):
-                    yield parent_
+        parents.append(parent)
+        path.append(parent)
+        stack.append(iter(direct_parents.get(parent, [])))
 
-    details = parser.get_all_mapping_details()
-    return list(_yield_parent_details(token, parser, details))
+    return parents
+
+
+def _decode_text(obj):
+    '''Decode obj as UTF-8 text if it is bytes (and not Python 2's str).'''
+    if isinstance(obj, six.binary_type) and not isinstance(obj, str):
+        return obj.decode('utf-8')
+
+    return obj
+
+
+def _decode_info(info):
+    '''Convert any bytes in some Asset info into text.
+
+    Context mappings and parse patterns are text so, on Python 3, bytes
+    would never match them. Python 2's str is already bytes and is left alone.
+
+    Args:
+        info (dict[str] or str or bytes): The info to convert.
+
+    Returns:
+        dict[str] or str: The info, with every bytes object decoded.
+
+    '''
+    if not isinstance(info, common.Mapping):
+        return _decode_text(info)
+
+    decoded = {key: _decode_text(value) for key, value in six.iteritems(info)}
+
+    # Only make a new dict if something was actually decoded
+    if all(decoded[key] is value for key, value in six.iteritems(info)):
+        return info
+
+    return decoded
 
 
 def get_asset(info, context=None, *args, **kwargs):
@@ -642,6 +815,8 @@ def get_asset(info, context=None, *args, **kwargs):
         for the given Context, return a generic Asset object.
 
     '''
+    info = _decode_info(info)
+
     if not context:
         context_ = _find_context_using_info(info)
         if context_ is None:
@@ -655,13 +830,87 @@ def get_asset(info, context=None, *args, **kwargs):
         raise ValueError('Context: "{context}" could not be found. '
                          'Cannot continue.'.format(context=context))
 
-    info = expand_info(info, context=context)
-    hierarchy = context.get_hierarchy()
+    return _make_asset(_get_asset_init(context), info, context, args, kwargs)
+
+
+def get_assets(infos, context=None, *args, **kwargs):
+    '''Get an Asset-like object for each info, all at once.
+
+    This function gives the same result as calling get_asset for each info.
+    But if a context is given, everything about the Context that
+    every Asset needs is only looked up once.
+
+    Args:
+        infos (iterable[dict[str] or str]):
+            The info for each Asset. See get_asset for details.
+        context (:class:`ways.api.Context` or str or tuple[str]`, optional):
+            The Context to use for every asset. If nothing is given, the
+            best possible Context is "found" for each info, separately.
+            Default is None.
+        *args (list): Optional position variables to pass to our found
+                      class's constructor.
+        **kwargs (dict): Optional keyword variables to pass to our found
+                         class's constructor.
+
+    Raises:
+        ValueError: If the given context could not be found.
 
-    _, init = registry.get_asset_info(hierarchy)
+    Returns:
+        list: The found class objects or NoneType, one for each info.
+
+    '''
+    if not context:
+        return [get_asset(info, None, *args, **kwargs) for info in infos]
+
+    context_ = sit.get_context(context)
+
+    if not context_:
+        raise ValueError('Context: "{context}" could not be found. '
+                         'Cannot continue.'.format(context=context))
+
+    init = _get_asset_init(context_)
+    patterns = dict()
+
+    return [_make_asset(init, _decode_info(info), context_, args, kwargs, patterns=patterns)
+            for info in infos]
+
+
+def _get_asset_init(context):
+    '''callable: Get the function that creates Asset objects for a Context.'''
+    _, init = registry.get_asset_info(context.get_hierarchy())
 
     if not init:
-        init = registry.make_default_init(Asset)
+        init = Asset
+
+    return init
+
+
+# pylint: disable=too-many-arguments
+def _make_asset(init, info, context, args, kwargs, patterns=None):
+    '''Expand some info and use it to create an Asset-like object.
+
+    Args:
+        init (callable):
+            The function that creates the object.
+        info (dict[str] or str):
+            The info to expand and then pass to init.
+        context (:class:`ways.api.Context`):
+            The Context to use to expand info and create the object.
+        args (tuple):
+            Position variables to pass to init.
+        kwargs (dict[str]):
+            Keyword variables to pass to init.
+        patterns (:obj:`dict[str: str]`, optional):
+            The parse patterns of context to use to expand info.
+
+    Returns:
+        The created object or NoneType, if it could not be created.
+
+    '''
+    # Expand info here, once. Asset.__init__ calls expand_info too but, since
+    # info is already a dict by then, it's returned without being parsed again
+    #
+    info = expand_info(info, context=context, patterns=patterns)
 
     try:
         return init(info, context, *args, **kwargs)
@@ -690,26 +939,25 @@ def _get_missing_required_tokens(context, info):
 
     '''
     parser = context.get_parser()
-    required_tokens = parser.get_required_tokens()
 
     # Start filling the parser
-    for key, value in six.iteritems(info):
-        parser[key] = value
+    parser.update(info)
 
     # Get missing tokens
-    missing_tokens = []
-    for token in required_tokens:
-        if token not in parser:
-            missing_tokens.append(token)
+    missing_tokens = [token for token in parser.get_required_tokens() if token not in parser]
+
+    if not missing_tokens:
+        return []
 
     # Try to resolve the tokens
+    resolved_tokens = set()
     for token in reversed(missing_tokens):
         value = _get_value(token, parser=parser, info=info)
         if value:
             parser[token] = value
-            missing_tokens.remove(token)
+            resolved_tokens.add(token)
 
-    return missing_tokens
+    return [token for token in missing_tokens if token not in resolved_tokens]
 
 
 def _get_value(name, parser, info):
@@ -749,493 +997,589 @@ def _get_value(name, parser, info):
         str: The value at the given token.
 
     '''
-    def get_value_from_parent(token, parser, info):
-        '''Get the value of a token by looking up at its parent, recursively.
+    # If we have a direct value for the given name, return it
+    value = info.get(name, __DEFAULT_OBJECT)
+    if value is not __DEFAULT_OBJECT:
+        return value
 
-        In order for this function to return anything, the parent of token
-        must be filled out. Or the parent of that parent etc etc.
+    details = parser.get_all_mapping_details()
 
-        This function is very special because it is able to use a mixture
-        of different text parsing engines to get the desired result.
+    # Child-Search is much cheaper than Parent-Search. So if every child
+    # token already has a value, build the value out of them, right away
+    #
+    if name not in parser:
+        mapping = details.get(name, dict()).get('mapping', '')
+        children = _find_tokens(mapping) if mapping else ()
 
-        Args:
-            token (str):
-                The token to get the value of, by looking at its parent(s).
-            parser (:class:`ways.api.ContextParser`):
-                The parser associated with the Context associated
-                with this Asset.
-            info (dict[str: str]):
-                All of the token-value pairs to use to find a value.
+        if children and all(child in info for child in children):
+            return mapping.format(**{child: info[child] for child in children})
 
-        Returns:
-            str: The found value. Returns nothing if no value was found.
+    value = _get_value_from_parent(name, parser, info)
+    if value:
+        return value
 
-        '''
-        def get_value_from_parent_regex(parent):
-            '''Use regex to get a value, using known parent tokens.
+    # Child-Search only runs last because, if some child tokens are
+    # missing, it still "succeeds" with a partially-filled value. The case
+    # where Child-Search is faster (every child has a value) already ran
+    #
+    return _get_value_from_children(name, info, details)
 
-            Args:
-                parent (str):
-                    The name of the parent token to try to get a
-                    parse-value for.
 
-            Returns:
-                dict[str]: The values that were found for each token
-                            and each parent token.
+def _get_value_from_parent_regex(parent, parser):
+    '''Use regex to get a value, using known parent tokens.
 
-            '''
-            details = parser.get_all_mapping_details()
-            try:
-                # We must have a mapping to proceed
-                details[parent]['mapping']
-            except KeyError:
-                return dict()
-
-            info = dict()
-            for child in parser.get_child_tokens(parent):
-                value = parser.get_value_from_parent(child, parent, 'regex')
-                info[child] = value
-
-            return info
-
-        def get_value_from_parent_format(parent):
-            '''Try to expand the parent token, using its mapping.
-
-            Note:
-                This function will basically always pass as long as
-                two things are true.
-                1. The mapping cannot have items side-by-side
-                    Example:
-                        valid - {FOO}_{BAR}
-                        invalid - {FOO}{BAR}
-
-                    If two items are back to back, we can't know where
-                    one item starts and one item ends. We'd need regex
-                    or glob or something else to determin that.
-                2. The value doesn't match the mapping.
-                    Example:
-                        valid -
-                            mapping - {FOO}_{BAR}
-                            value - SOME_THING
-                        invalid -
-                            mapping - {FOO}_{BAR}
-                            value - SOME-THING
-
-            Examples:
-                >>> parent = 'SHOT_NAME'
-                >>> value = 'SH_0020'
-                >>> details = {'SHOT_NAME': {'mapping': '{SHOT_PREFIX}_{SHOT_NUMBER}'}}
-                >>> get_value_from_parent_format(parent, value, details)
-                ... {'SHOT_PREFIX': 'SH', 'SHOT_NUMBER': '0020'}
-
-            Args:
-                parent (str):
-                    The parent token to expand and get the value of.
-
-            Returns:
-                dict[str: str]:
-                    The pieces of a string, broken into its various pieces.
-
-            '''
-            details = parser.get_all_mapping_details()
-            try:
-                value = parser[parent]
-                return common.expand_string(details[parent].get('mapping', ''), value)
-            except KeyError:
-                return dict()
+    Args:
+        parent (str):
+            The name of the parent token to try to get a
+            parse-value for.
+        parser (:class:`ways.api.ContextParser`):
+            The parser that will be used to parse the parent's value.
 
-        # Try once to get the value if the parser already has it
-        # If not, we'll try to search for it
-        #
-        try:
-            return parser[token]
-        except KeyError:
-            pass
+    Returns:
+        dict[str]: The values that were found for each token
+                    and each parent token.
 
-        parents = _get_recursive_parents(token, parser)
-
-        if not parents:
-            return ''
-
-        def build_value_from_parents(token, parents, info):
-            '''Get the value by checking every parent of a token recursively.
-
-            Warning:
-                This function will modify any parser that is passed into it.
-                The parser is changed intentionally so that the value
-                can be referenced during recursion (It's treated as
-                persistent data that gets reused).
-
-            Args:
-                token (str):
-                    The token to get the value of by looking at its parents.
-                parents (list[str]):
-                    The parents of token and any parents of those parents.
-                    This list should always start with the immediate parent
-                    of token, followed by other parents-of-parents.
-                info (dict[str: str]):
-                    All of the token-value pairs to use to find a value.
-
-            Returns:
-                str: The output value.
-
-            '''
-            options = [
-                get_value_from_parent_format,
-                get_value_from_parent_regex,
-            ]
-
-            for parent in parents:
-                value = ''
-                try:
-                    value = info[parent]
-                except KeyError:
-                    pass
-
-                for option in options:
-                    try:
-                        info = option(parent)
-                        value = info.get(token)
-                        if value:
-                            return value
-                    except Exception:
-                        pass
-
-                try:
-                    parents[1:]
-                except IndexError:
-                    return ''
-
-                # If we've reached this point, it means that we tried to get
-                # the value of the parent be couldn't. But there's another
-                # parent above this parent token so lets keep searching
-                # until there's no more parents to search
-                #
-                value = build_value_from_parents(parent, parents[1:], info)
-                if value:
-                    # NOTE: We intentionally add the found value to a parser
-                    #       before retrying to hopefully find the next value
-                    #       faster / more efficiently
-                    #
-                    parser[parent] = value
-                    return _get_value(token, parser=parser, info=info)
+    '''
+    try:
+        # We must have a mapping to proceed
+        mapping = parser.get_all_mapping_details()[parent]['mapping']
+    except KeyError:
+        return dict()
 
-            return ''
+    # The child tokens are read from the mapping, the same way that
+    # parser.get_child_tokens does, but each mapping is only searched once
+    #
+    info = dict()
+    for child in _find_tokens(mapping):
+        value = parser.get_value_from_parent(child, parent, 'regex')
+        info[child] = value
 
-        return build_value_from_parents(token, parents, info)
+    return info
 
-    def get_value_from_children(token, parser, info):
-        '''Get a value from a parent token by getting its child values.
 
-        Args:
-            token (str):
-                The token to get the value of by looking at its children.
-            parser (:class:`ways.api.ContextParser`):
-                The parser associated with the Context associated
-            info (dict[str: str]):
-                All of the token-value pairs to use to find a value.
+def _get_value_from_parent_format(parent, parser):
+    '''Try to expand the parent token, using its mapping.
 
-        Returns:
-            dict[str: str]: The found tokens and their values.
+    Note:
+        This function will basically always pass as long as
+        two things are true.
+        1. The mapping cannot have items side-by-side
+            Example:
+                valid - {FOO}_{BAR}
+                invalid - {FOO}{BAR}
+
+            If two items are back to back, we can't know where
+            one item starts and one item ends. We'd need regex
+            or glob or something else to determin that.
+        2. The value doesn't match the mapping.
+            Example:
+                valid -
+                    mapping - {FOO}_{BAR}
+                    value - SOME_THING
+                invalid -
+                    mapping - {FOO}_{BAR}
+                    value - SOME-THING
+
+    Examples:
+        >>> # This example is illustrative. It assumes that a 'job/shot'
+        >>> # Context defines SHOT_NAME's mapping as '{SHOT_PREFIX}_{SHOT_NUMBER}'
+        >>> parser = ways.api.get_context('job/shot').get_parser()
+        >>> parser['SHOT_NAME'] = 'SH_0020'
+        >>> _get_value_from_parent_format('SHOT_NAME', parser)
+        ... {'SHOT_PREFIX': 'SH', 'SHOT_NUMBER': '0020'}
 
-        '''
-        mapping = details.get(token, dict()).get('mapping', '')
-        if not mapping:
-            return ''
+    Args:
+        parent (str):
+            The parent token to expand and get the value of.
+        parser (:class:`ways.api.ContextParser`):
+            The parser that contains the parent's value.
 
-        children = parser.get_child_tokens(token)
-        if not children:
-            return ''
+    Returns:
+        dict[str: str]:
+            The pieces of a string, broken into its various pieces.
 
-        info_ = dict()
+    '''
+    try:
+        value = parser[parent]
+        details = parser.get_all_mapping_details()
+        return common.expand_string(details[parent].get('mapping', ''), value)
+    except KeyError:
+        return dict()
 
-        for child in children:
-            try:
-                value = info[child]
-            except KeyError:
-                value = get_value_from_children(child, parser, info)
 
-            info_[child] = value
+# The different ways to get a token's value from one of its parent tokens
+__PARENT_VALUE_OPTIONS = (
+    _get_value_from_parent_format,
+    _get_value_from_parent_regex,
+)
+# The errors that mean that an option could not get a value from a parent.
+# For example, a parent without a value or a regex match without the
+# token's group. RuntimeError is the base of RecursionError (and what
+# Python 2 raises instead). The parse engine can recurse forever on
+# tokens that refer to each other, so that counts as "no value", too
+#
+__PARENT_VALUE_ERRORS = (
+    AttributeError,
+    IndexError,
+    KeyError,
+    RuntimeError,
+    TypeError,
+    ValueError,
+    re.error,
+)
+
+
+def _get_value_from_parent(token, parser, info):
+    '''Get the value of a token by looking up at its parent, recursively.
+
+    In order for this function to return anything, the parent of token
+    must be filled out. Or the parent of that parent etc etc.
+
+    This function is very special because it is able to use a mixture
+    of different text parsing engines to get the desired result.
+
+    Args:
+        token (str):
+            The token to get the value of, by looking at its parent(s).
+        parser (:class:`ways.api.ContextParser`):
+            The parser associated with the Context associated
+            with this Asset.
+        info (dict[str: str]):
+            All of the token-value pairs to use to find a value.
 
-        return mapping.format(**info_)
+    Returns:
+        str: The found value. Returns nothing if no value was found.
 
+    '''
+    # Try once to get the value if the parser already has it
+    # If not, we'll try to search for it
+    #
     try:
-        # If we have a direct value for the given name, return it
-        return info[name]
+        return parser[token]
     except KeyError:
         pass
 
-    details = parser.get_all_mapping_details()
+    parents = _get_recursive_parents(token, parser)
 
-    value = get_value_from_parent(name, parser, info)
-    if value:
+    if not parents:
+        return ''
+
+    return _build_value_from_parents(token, parents, parser, info)
+
+
+def _build_value_from_parents(token, parents, parser, info, start=0):
+    '''Get the value by checking every parent of a token recursively.
+
+    Warning:
+        This function will modify any parser that is passed into it.
+        The parser is changed intentionally so that the value
+        can be referenced during recursion (It's treated as
+        persistent data that gets reused).
+
+    Args:
+        token (str):
+            The token to get the value of by looking at its parents.
+        parents (list[str]):
+            The parents of token and any parents of those parents.
+            This list should always start with the immediate parent
+            of token, followed by other parents-of-parents.
+        parser (:class:`ways.api.ContextParser`):
+            The parser associated with the Context associated
+            with this Asset.
+        info (dict[str: str]):
+            All of the token-value pairs to use to find a value.
+        start (:obj:`int`, optional):
+            The index in parents to start searching from. This is
+            used instead of slicing parents on every recursion.
+            Default is 0.
+
+    Returns:
+        str: The output value.
+
+    '''
+    for index in six.moves.range(start, len(parents)):
+        parent = parents[index]
+
+        for option in __PARENT_VALUE_OPTIONS:
+            try:
+                info = option(parent, parser)
+            except __PARENT_VALUE_ERRORS:
+                continue
+
+            value = info.get(token)
+            if value:
+                return value
+
+        # If we've reached this point, it means that we tried to get
+        # the value of the parent be couldn't. But there's another
+        # parent above this parent token so lets keep searching
+        # until there's no more parents to search
+        #
+        value = _build_value_from_parents(parent, parents, parser, info, start + 1)
+        if value:
+            # NOTE: We intentionally add the found value to a parser
+            #       before retrying to hopefully find the next value
+            #       faster / more efficiently
+            #
+            parser[parent] = value
+            return _get_value(token, parser=parser, info=info)
+
+    return ''
+
+
+def _get_value_from_children(token, info, details, memo=None):
+    '''Get a value from a parent token by getting its child values.
+
+    Args:
+        token (str):
+            The token to get the value of by looking at its children.
+        info (dict[str: str]):
+            All of the token-value pairs to use to find a value.
+        details (dict[str]):
+            The combined mapping details to get child tokens from.
+        memo (:obj:`dict[str: str]`, optional):
+            The values of any tokens that were already built. Child
+            tokens that are shared by more than one parent are only
+            built once. If nothing is given, a new memo is started.
+
+    Returns:
+        dict[str: str]: The found tokens and their values.
+
+    '''
+    if memo is None:
+        memo = dict()
+
+    value = memo.get(token, __DEFAULT_OBJECT)
+    if value is not __DEFAULT_OBJECT:
         return value
 
-    # TODO : swap Parent-Search and Child-Search. More often than not,
-    #        it will make systems faster (I think)
+    mapping = details.get(token, dict()).get('mapping', '')
+    # The child tokens are read from details, the same way that
+    # parser.get_child_tokens does, so that details aren't rebuilt
     #
-    return get_value_from_children(name, parser, info)
+    children = _find_tokens(mapping) if mapping else ()
 
+    if not children:
+        memo[token] = ''
+        return ''
 
-def _find_context_using_info(obj):
-    '''Use some Asset's info, get the best-possible Context.
+    info_ = dict()
 
-    This function is meant to assist "get_asset" whenever a Context is not given.
+    for child in children:
+        value = info.get(child, __DEFAULT_OBJECT)
+        if value is __DEFAULT_OBJECT:
+            value = _get_value_from_children(child, info, details, memo)
 
-    It works first by getting every Context that could work with the given object.
-    Then, if more than one Context matches the given object, we attempt to
-    "break the tie" between all of the Contexts to get a clear winner. This is
-    done by looking at every Token defined in "mapping_details", to try to
-    find if the user's input matches each of the Tokens on the Context.
+        info_[child] = value
 
-    If obj is a string and the match Contexts have mappings, this function runs
-    much more quickly because Ways will sort the valid Contexts by how close
-    obj resembles the mapping. So the more "relevant" Contexts are tried before
-    lesser Contexts.
+    memo[token] = mapping.format(**info_)
 
-    It's best to give a string whenever possible.
+    return memo[token]
+
+
+def _contains_all_tokens(context, obj):
+    '''Check that every token in a Context has a vaild value.
 
     Args:
-        obj (dict[str: str] or str):
-            The information used to get the Context.
-            It's best to give a string whenever possible but a dict can be
-            used instead, if not.
+        context (:class:`ways.api.Context`):
+            The Context to check for valid token values.
+        obj (dict[str: str]):
+            The token-value pairs for our Context to check if they're valid.
 
     Returns:
-        :class:`ways.api.Context`: The "best-guess" Context for some information.
+        bool: If every token for our Context has a valid value.
 
     '''
-    def contains_all_tokens(context, obj):
-        '''Check that every token in a Context has a vaild value.
+    parser = context.get_parser()
+    details = parser.get_all_mapping_details()
 
-        Args:
-            context (:class:`ways.api.Context`):
-                The Context to check for valid token values.
-            obj (dict[str: str]):
-                The token-value pairs for our Context to check if they're valid.
+    # If the user passed in more information than necessary, any extra
+    # tokens are just skipped. So only check tokens that are in both
+    #
+    for token in set(obj).intersection(details):
+        # Check to make sure our value is OK
+        if not parser.is_valid(token, obj[token], details=details):
+            return False
 
-        Returns:
-            bool: If every token for our Context has a valid value.
+    return not _get_missing_required_tokens(context, obj)
 
-        '''
-        parser = context.get_parser()
-        details = parser.get_all_mapping_details()
 
-        for token, value in six.iteritems(obj):
-            if token not in details:
-                # If this section of code runs, it means the user passed in
-                # more information that necessary. Just skip it
-                #
-                continue
+def _get_comparable_mapping(context, context_mappings):
+    '''Get the mapping of a Context, without any of its tokens.
 
-            # Check to make sure our value is OK
-            if not parser.is_valid(token, value):
-                return False
+    Args:
+        context (:class:`ways.api.Context`):
+            The Context to get the mapping of.
+        context_mappings (dict[:class:`ways.api.Context`: str]):
+            The mapping of every Context whose mapping is already known.
 
-        return not _get_missing_required_tokens(context, obj)
+    Returns:
+        str: The mapping, without any tokens.
 
-    def get_ranking(context, obj):
-        '''Find how similar a given string is to a Context's mapping.
+    '''
+    try:
+        mapping = context_mappings[context]
+    except KeyError:
+        mapping = context.get_mapping()
 
-        Args:
-            context (:class:`ways.api.Context`):
-                The context to get the mapping of and use for ranking.
-            obj (str):
-                The string to compare to the given Context and rank.
+    # This algorithm gets thrown off by any contents inside {}s
+    # so we're going to make the mapping from strings like
+    # '/jobs/{JOBS}/here' into '/jobs//here' to make the sort more fair
+    #
+    return _remove_tokens(mapping)
 
-        Returns:
-            float:
-                A value from 0 to N - 0 being having no correlation and N
-                being some increasing correlation.
 
-        '''
-        mapping = context.get_mapping()
-        # This algorithm gets thrown off by any contents inside {}s
-        # so we're going to make the mapping from strings like
-        # '/jobs/{JOBS}/here' into '/jobs//here' to make the sort more fair
-        #
-        mapping = re.sub('({[^{}]*})', '', mapping)
+def _get_best_context_by_rankings(contexts, mapping, context_mappings):
+    '''Find the Context that best matches a mapping.
 
-        return pylev.levenshtein(mapping, obj)
+    Each Context is ranked by how similar the given string is to
+    the Context's mapping.
 
-    def get_best_context_by_rankings(contexts, mapping):
-        '''Find the Context that best matches a mapping.
+    Args:
+        contexts (list[:class:`ways.api.Context`]):
+            The Context objects to consider.
+        mapping (str):
+            The asset string that will be used to find the best Context.
+            The "best" Context is determined by how closely a Context's
+            mapping is, compared to this given mapping.
+        context_mappings (dict[:class:`ways.api.Context`: str]):
+            The mapping of every Context whose mapping is already known.
 
-        Args:
-            contexts (list[:class:`ways.api.Context`]):
-                The Context objects to consider.
-            mapping (str):
-                The asset string that will be used to find the best Context.
-                The "best" Context is determined by how closely a Context's
-                mapping is, compared to this given mapping.
+    Raises:
+        ValueError:
+            If two values tie for the "best" Context and Ways cannot
+            choose one of them.
 
-        Raises:
-            ValueError:
-                If two values tie for the "best" Context and Ways cannot choose
-                one of them.
+    Returns:
+        :class:`ways.api.Context` or NoneType:
+            The best match or nothing, if no Context objects were given.
 
-        Returns:
-            :class:`ways.api.Context`: The best match.
+    '''
+    if not contexts:
+        return None
 
-        '''
-        rankings = [get_ranking(context, mapping) for context in contexts]
-        high_score = max(rankings)
+    # Find the high score and every Context that got it, in one pass
+    high_score = None
+    high_scorers = []
+    for context in contexts:
+        comparable_mapping = _get_comparable_mapping(context, context_mappings)
 
-        # If the high score is listed twice then we can't know which Context
-        # to use so raise an error
+        # The ranking can never be more than the length of the longer
+        # string. If that can't reach the high score, skip the ranking
         #
-        high_scorers = []
-        for context, ranking in six.moves.zip(contexts, rankings):
-            if ranking == high_score:
-                high_scorers.append(context)
+        most = max(len(comparable_mapping), len(mapping))
+        if high_score is not None and most < high_score:
+            continue
 
-        there_was_a_tie_for_first_place = len(high_scorers) > 1
+        ranking = pylev.levenshtein(comparable_mapping, mapping)
 
-        if there_was_a_tie_for_first_place:
-            raise ValueError(
-                'Two or more Context objects were selected. Cannot continue.',
-                high_scorers)
+        if high_score is None or ranking > high_score:
+            high_score = ranking
+            high_scorers = [context]
+        elif ranking == high_score:
+            high_scorers.append(context)
+
+    # If the high score is listed twice then we can't know which Context
+    # to use so raise an error
+    #
+    there_was_a_tie_for_first_place = len(high_scorers) > 1
 
-        return contexts[rankings.index(high_score)]
+    if there_was_a_tie_for_first_place:
+        raise ValueError(
+            'Two or more Context objects were selected. Cannot continue.',
+            high_scorers)
 
-    def get_context_info_from_pool(contexts, pool):
-        '''Assign information to given Contexts using a pool of Context info.
+    return high_scorers[0]
 
-        To keep computations light, we filter out the best possible Context
-        candidates and then get their information from the total Contexts.
 
-        Args:
-            contexts (list[:class:`ways.api.Context`]):
-                The Context objects to get token information for.
-            pool (list[tuple[:class:`ways.api.Context`, dict[str, str]]]):
-                All of the known Contexts and their token info that Ways knows of.
+def _get_context_info_from_pool(contexts, pool):
+    '''Assign information to given Contexts using a pool of Context info.
 
-        Returns:
-            pool (list[tuple[:class:`ways.api.Context`, dict[str, str]]]):
-                The original Context objects and its pool information.
+    To keep computations light, we filter out the best possible Context
+    candidates and then get their information from the total Contexts.
 
-        '''
-        return {context: pool[context] for context in contexts}
+    Args:
+        contexts (list[:class:`ways.api.Context`]):
+            The Context objects to get token information for.
+        pool (list[tuple[:class:`ways.api.Context`, dict[str, str]]]):
+            All of the known Contexts and their token info that Ways knows of.
 
-    def get_valid_contexts(info):
-        '''Filter out Contexts that expect different info that what is given.
+    Returns:
+        pool (list[tuple[:class:`ways.api.Context`, dict[str, str]]]):
+            The original Context objects and its pool information.
 
-        Args:
-            info (list[tuple[:class:`ways.api.Context`, dict[str, str]]]):
-                All of the known Contexts and their token info that Ways knows of.
+    '''
+    return {context: pool[context] for context in contexts}
 
-        Returns:
-            list[:class:`ways.api.Context`]:
-                The Context objects that are all compatible with their given info.
 
-        '''
-        valid_contexts = []
-        for context, details in six.iteritems(info):
-            parser = context.get_parser()
+def _get_valid_contexts(info):
+    '''Filter out Contexts that expect different info that what is given.
 
-            # We're going to try to invalidate every token of a Context using
-            # every parser that Ways knows about. If the Context doesn't
-            # ever return False then that means it is 'valid'
-            #
-            tokens_and_parsers = itertools.product(
-                six.iteritems(details), ways.get_parse_order())
-            for (token, value), parse_type in tokens_and_parsers:
-                if not parser.is_valid(token, value, parse_type):
+    Args:
+        info (list[tuple[:class:`ways.api.Context`, dict[str, str]]]):
+            All of the known Contexts and their token info that Ways knows of.
+
+    Returns:
+        list[:class:`ways.api.Context`]:
+            The Context objects that are all compatible with their given info.
+
+    '''
+    parse_order = ways.get_parse_order()
+    valid_contexts = []
+
+    for context, details in six.iteritems(info):
+        parser = context.get_parser()
+        # Every token and parse type is checked against the same
+        # mapping details so only get them once, per-Context
+        #
+        mapping_details = parser.get_all_mapping_details()
+
+        # We're going to try to invalidate every token of a Context using
+        # every parser that Ways knows about. If the Context doesn't
+        # ever return False then that means it is 'valid'
+        #
+        is_valid = True
+        for token, value in six.iteritems(details):
+            for parse_type in parse_order:
+                if not parser.is_valid(token, value, parse_type, details=mapping_details):
+                    is_valid = False
                     break
-            else:
-                valid_contexts.append(context)
 
-        return valid_contexts
+            if not is_valid:
+                break
 
-    def tiebreak(contexts, info):  # pylint: disable=inconsistent-return-statements
-        '''Attempt to find the "best" Context from a group of tied Contexts.
+        if is_valid:
+            valid_contexts.append(context)
 
-        Ways does this by looking at the parse groups defined for each Context.
-        If the Context objects's found information doesn't match what the
-        Context expects, it's "excluded". The Context that survives validation
-        is declared the "winner" because there was nothing wrong with it.
+    return valid_contexts
 
-        Args:
-            contexts (list[:class:`ways.api.Context`]):
-                The tied Context objects to get a "best" Context of.
-            info (list[dict[:class:`ways.api.Context`: dict[str, str]]]):
-                All of the known Contexts and their token info that Ways knows of.
 
-        Raises:
-            ValueError:
-                If the tie could not be broken. i.e. Two or more Contexts
-                with are both valid, given the user's information.
+def _tiebreak(contexts, info):  # pylint: disable=inconsistent-return-statements
+    '''Attempt to find the "best" Context from a group of tied Contexts.
 
-        Returns:
-            :class:`ways.api.Context` or NoneType: The "winner" Context.
+    Ways does this by looking at the parse groups defined for each Context.
+    If the Context objects's found information doesn't match what the
+    Context expects, it's "excluded". The Context that survives validation
+    is declared the "winner" because there was nothing wrong with it.
 
-        '''
-        tied_info = get_context_info_from_pool(contexts, info)
-        valid_contexts = get_valid_contexts(tied_info)
+    Args:
+        contexts (list[:class:`ways.api.Context`]):
+            The tied Context objects to get a "best" Context of.
+        info (dict[:class:`ways.api.Context`: dict[str, str]]):
+            All of the known Contexts and their token info that Ways knows of.
 
-        if not valid_contexts:
-            return
-        elif len(valid_contexts) == 1:
-            # Tie-break succeeded
-            return valid_contexts[0]
+    Raises:
+        ValueError:
+            If the tie could not be broken. i.e. Two or more Contexts
+            with are both valid, given the user's information.
 
-        raise ValueError(
-            'Ways got two or more Contexts and cannot decide which to use, '
-            '"{contexts!s}".'.format(contexts=[str(context) for context in contexts]))
+    Returns:
+        :class:`ways.api.Context` or NoneType: The "winner" Context.
 
-    def find_context_by_mapping(mapping, contexts):
-        '''Get the correct Context by matching the user's mapping.
+    '''
+    tied_info = _get_context_info_from_pool(contexts, info)
+    valid_contexts = _get_valid_contexts(tied_info)
 
-        As the function implies, at least one Context given must have a mapping
-        and that mapping should match the Context.
+    if not valid_contexts:
+        return
+    elif len(valid_contexts) == 1:
+        # Tie-break succeeded
+        return valid_contexts[0]
 
-        Args:
-            mapping (str): The mapping that is expected to match the Contexts.
-            contexts (list[:class:`ways.api.Context`]): The Contexts to match with.
+    raise ValueError(
+        'Ways got two or more Contexts and cannot decide which to use, '
+        '"{contexts!s}".'.format(contexts=[str(context) for context in contexts]))
 
-        Returns:
-            :class:`ways.api.Context`: The "winner" Context.
 
-        '''
+def _find_context_by_mapping(mapping, contexts, context_mappings):
+    '''Get the correct Context by matching the user's mapping.
+
+    As the function implies, at least one Context given must have a mapping
+    and that mapping should match the Context.
+
+    Args:
+        mapping (str):
+            The mapping that is expected to match the Contexts.
+        contexts (dict[:class:`ways.api.Context`: dict[str, str]]):
+            The Contexts to match with and their token info.
+        context_mappings (dict[:class:`ways.api.Context`: str]):
+            The mapping of every Context whose mapping is already known.
+
+    Returns:
+        :class:`ways.api.Context`: The "winner" Context.
+
+    '''
+    try:
+        return _get_best_context_by_rankings(list(contexts.keys()), mapping, context_mappings)
+    except ValueError as err:
+        # Try to break the tie, if we can
+        tied_contexts = err.args[-1]
+    return _tiebreak(tied_contexts, contexts)
+
+
+def _filter_valid_contexts(info, contexts):
+    '''Use the given information to find the correct Context.
+
+    This function is very basic. All it does it tries to build an Asset,
+    using the given Context information. If the Asset successfully
+    instantiates, it's assumed that the info was correct.
+
+    Args:
+        info (dict[str, str]): The information to try to get a Context of.
+        contexts (list[:class:`ways.api.Context`]): The Contexts to match.
+
+    Returns:
+        list[:class:`ways.api.Context`]: The Contexts that make valid Assets,
+                                         when given some info.
+
+    '''
+    output = []
+    for context in contexts:
         try:
-            return get_best_context_by_rankings(list(contexts.keys()), mapping)
-        except ValueError as err:
-            # Try to break the tie, if we can
-            tied_contexts = err.args[-1]
-        return tiebreak(tied_contexts, contexts)
+            Asset(info, context)
+        except ValueError:
+            # The object was not valid input for the Asset. Just ignore it and move on
+            continue
 
-    def filter_valid_contexts(info, contexts):
-        '''Use the given information to find the correct Context.
+        output.append(context)
 
-        This function is very basic. All it does it tries to build an Asset,
-        using the given Context information. If the Asset successfully
-        instantiates, it's assumed that the info was correct.
+    return output
 
-        Args:
-            info (dict[str, str]): The information to try to get a Context of.
-            contexts (list[:class:`ways.api.Context`]): The Contexts to match.
 
-        Returns:
-            list[:class:`ways.api.Context`]: The Contexts that make valid Assets,
-                                             when given some info.
+def _find_context_using_info(obj):
+    '''Use some Asset's info, get the best-possible Context.
 
-        '''
-        output = []
-        for context in six.iterkeys(contexts):
-            try:
-                Asset(info, context)
-            except ValueError:
-                # The object was not valid input for the Asset. Just ignore it and move on
-                continue
+    This function is meant to assist "get_asset" whenever a Context is not given.
 
-            output.append(context)
+    It works first by getting every Context that could work with the given object.
+    Then, if more than one Context matches the given object, we attempt to
+    "break the tie" between all of the Contexts to get a clear winner. This is
+    done by looking at every Token defined in "mapping_details", to try to
+    find if the user's input matches each of the Tokens on the Context.
 
-        return output
+    If obj is a string and the match Contexts have mappings, this function runs
+    much more quickly because Ways will sort the valid Contexts by how close
+    obj resembles the mapping. So the more "relevant" Contexts are tried before
+    lesser Contexts.
+
+    It's best to give a string whenever possible.
+
+    Args:
+        obj (dict[str: str] or str):
+            The information used to get the Context.
+            It's best to give a string whenever possible but a dict can be
+            used instead, if not.
 
+    Returns:
+        :class:`ways.api.Context`: The "best-guess" Context for some information.
+
+    '''
     mapping = ''
     contexts_ = sit.get_all_contexts()
     contexts = collections.OrderedDict()
-    if not isinstance(obj, collections.Mapping):
+    # Each Context's mapping is needed more than once so only get it once
+    context_mappings = dict()
+    if not isinstance(obj, common.Mapping):
         mapping = obj
 
         # The user gave a string - so let's make it into a dict
@@ -1244,7 +1588,8 @@ def _find_context_using_info(obj):
         #
         for context in contexts_:
             try:
-                expanded_info = common.expand_string(context.get_mapping(), obj)
+                context_mappings[context] = context.get_mapping()
+                expanded_info = common.expand_string(context_mappings[context], obj)
                 if not expanded_info:
                     raise ValueError
             except (ValueError, RuntimeError):
@@ -1258,26 +1603,32 @@ def _find_context_using_info(obj):
     else:
         # Otherwise, if it is a mapping (i.e. a dict), we use all contexts
         for context in contexts_:
-            if contains_all_tokens(context, obj):
+            if _contains_all_tokens(context, obj):
                 contexts[context] = obj
 
+        # _contains_all_tokens already ran the same checks that an Asset
+        # would, so if there's only one Context left, it's the winner
+        #
+        if len(contexts) == 1:
+            return next(iter(contexts))
+
     # We'll find the Context we're searching for faster if we sort the more
     # likely candidates to the front. But we can only do that if obj is a string
     #
     if mapping:
-        return find_context_by_mapping(mapping, contexts)
+        return _find_context_by_mapping(mapping, contexts, context_mappings)
 
     # Otherwise, lets just try to find the best-guess
-    valid_contexts = filter_valid_contexts(obj, contexts)
+    valid_contexts = _filter_valid_contexts(obj, contexts)
 
     if len(valid_contexts) == 1:
         return valid_contexts[0]
 
     # More than one Context was valid. Try to find one clear winner, if we can
-    return tiebreak(valid_contexts, contexts)
+    return _tiebreak(valid_contexts, contexts)
 
 
-def expand_info(info, context=None):
+def expand_info(info, context=None, patterns=None):
     '''Get parsed information, using the given Context.
 
     Note:
@@ -1297,6 +1648,9 @@ def expand_info(info, context=None):
             The Context that will be used to parse info.
             If no Context is given, the Context is automatically found.
             Default is None.
+        patterns (:obj:`dict[str: str]`, optional):
+            The parse patterns of context, if they're already known.
+            Any pattern that gets created is added to this dict.
 
     Raises:
         NotImplementedError:
@@ -1317,10 +1671,13 @@ def expand_info(info, context=None):
     #      context mapping is '/jobs/{JOB}/here'
     #      Result: {'JOB': 'jobName'}
     #
-    try:
-        return _expand_using_context(context, info, default=dict())
-    except AttributeError:
-        pass
+    # Without a Context, this always raises AttributeError so it's skipped
+    #
+    if context is not None:
+        try:
+            return _expand_using_context(context, info, default=dict(), patterns=patterns)
+        except AttributeError:
+            pass
 
     # Is it an iterable-pair object that we can make into a dict?
     # i.e. (('some': 'thing'), ) -> {'some': 'thing'}
@@ -17,6 +17,7 @@ import six
 import ways
 
 # IMPORT LOCAL LIBRARIES
+from ..base import plugin as plug
 from ..base import situation as sit
 from ..core import loop
 from ..helper import common
@@ -59,6 +60,26 @@ def _get_ways_uuid_from_plugin(obj):
     return uuid_
 
 
+def _get_hierarchy_from_plugin(plugin):
+    '''Get the hierarchy of a plugin that was registered to Ways.
+
+    Every plugin in ways.PLUGIN_CACHE must define get_hierarchy so,
+    unlike trace_hierarchy, there's no need to search for a Context.
+
+    Args:
+        plugin (:class:`ways.api.Plugin`): The plugin to get the hierarchy of.
+
+    Returns:
+        tuple[str]: The hierarchy of the plugin.
+
+    '''
+    hierarchy = plugin.get_hierarchy()
+    if not hierarchy:
+        return tuple()
+
+    return common.intern_hierarchy(hierarchy)
+
+
 def startswith(base, leaf):
     '''Check if all tuple items match the start of another tuple.
 
@@ -201,8 +222,12 @@ def trace_context(obj):
         return obj
 
     # Is it a AssetFinder?
-    if 'finder' in dir(obj):
-        obj = obj.finder
+    #
+    # Note: Don't use dir(obj) to check for "finder". Find and AssetFinder
+    #       build their __dir__ from every registered Action name, which
+    #       is much more expensive than a single attribute lookup
+    #
+    obj = getattr(obj, 'finder', obj)
 
     # Try to find the context - assuming obj was finder.Find or an action, etc.
     try:
@@ -223,20 +248,10 @@ def trace_context(obj):
 
 def trace_assignment(obj):
     '''str: Get the assignment for this object.'''
-    try:
-        obj = obj.finder
-    except AttributeError:
-        pass
+    obj = getattr(obj, 'finder', obj)
+    obj = getattr(obj, 'context', obj)
 
-    try:
-        obj = obj.context
-    except AttributeError:
-        pass
-
-    try:
-        return obj.get_assignment()
-    except AttributeError:
-        return common.DEFAULT_ASSIGNMENT
+    return plug.get_assignment(obj)
 
 
 def trace_hierarchy(obj):  # noqa: D301
@@ -255,28 +270,22 @@ def trace_hierarchy(obj):  # noqa: D301
     '''
     hierarchy = ''
 
-    try:
-        hierarchy = obj.get_hierarchy()
-    except AttributeError:
-        pass
+    get_hierarchy = getattr(obj, 'get_hierarchy', None)
+    if get_hierarchy is not None:
+        hierarchy = get_hierarchy()
 
     if hierarchy:
-        return common.split_hierarchy(hierarchy)
+        return common.intern_hierarchy(hierarchy)
 
     obj = trace_context(obj)
 
     if obj is None:
         return tuple()
 
-    hierarchy = tuple()
-
-    try:
-        hierarchy = obj.hierarchy
-    except AttributeError:
-        pass
+    hierarchy = getattr(obj, 'hierarchy', tuple())
 
     if hierarchy:
-        return common.split_hierarchy(hierarchy)
+        return common.intern_hierarchy(hierarchy)
 
     return hierarchy
 
@@ -322,8 +331,15 @@ def _get_hierarchy_tree(
 
             part = hook(part)
 
-            previous_dict.setdefault(part, dict())
-            previous_dict = previous_dict[part]
+            # Sibling hierarchies share most of their parts so only make a
+            # new dict when a part is actually missing from the tree
+            #
+            child_dict = previous_dict.get(part)
+            if child_dict is None:
+                child_dict = dict()
+                previous_dict[part] = child_dict
+
+            previous_dict = child_dict
 
     return output
 
@@ -383,7 +399,16 @@ def get_all_action_hierarchies():
 
 def get_all_hierarchies():
     '''set[tuple[str]]: The Contexts that have plugins in our environment.'''
-    return set(trace_hierarchy(plug) for plug in ways.PLUGIN_CACHE.get('all', []))
+    hierarchies = set()
+
+    for plugin in ways.PLUGIN_CACHE.get('all', []):
+        hierarchy = _get_hierarchy_from_plugin(plugin)
+
+        # A plugin with no hierarchy doesn't describe any Context so skip it
+        if hierarchy:
+            hierarchies.add(hierarchy)
+
+    return hierarchies
 
 
 def get_all_hierarchy_trees(full=False):
@@ -434,7 +459,7 @@ def get_all_hierarchy_trees(full=False):
 
 def get_all_assignments():
     '''set[str]: All of the assignments found in our environment.'''
-    return set(trace_assignment(plug) for plug in ways.PLUGIN_CACHE.get('all', []))
+    return {plug.get_assignment(plugin) for plugin in ways.PLUGIN_CACHE.get('all', [])}
 
 
 def get_child_hierarchies(hierarchy):
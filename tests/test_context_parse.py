@@ -290,3 +290,23 @@ class ContextParserMethodTestCase(common_test.ContextTestCase):
         parser = context.get_parser()
 
         self.assertEqual(set(parser.get_tokens()), {'THING', 'JOB'})
+
+    def test_update(self):
+        '''Set many token values on a parser at once.'''
+        contents = textwrap.dedent(
+            '''
+            globals: {}
+            plugins:
+                a_parse_plugin:
+                    hierarchy: whatever
+                    mapping: /jobs/{JOB}/some_kind/of/real_folders/{THING}
+                    uuid: 0d255517-dbbf-4a49-a8d0-285a06b2aa6d
+            ''')
+
+        self._make_plugin_sheet(contents=contents)
+
+        context = ways.api.get_context('whatever')
+        parser = context.get_parser()
+        parser.update({'JOB': 'foo', 'THING': 'bar'})
+
+        self.assertEqual(('foo', 'bar'), (parser['JOB'], parser['THING']))
@@ -171,6 +171,22 @@ class PluginMethodTestCase(common_test.ContextTestCase):
         context = ways.api.get_context('31tt/whatever')
         self.assertEqual(context.get_groups(), ('some_groups', 'another'))
 
+    def test_data_not_shared(self):
+        '''Make sure that Plugin objects of the same class do not share data.'''
+        class SomePlugin(ways.api.Plugin):
+
+            '''A Plugin that is not added to Ways.'''
+
+            add_to_registry = False
+
+        first = SomePlugin()
+        second = SomePlugin()
+
+        first.data['color'] = 'red'
+
+        self.assertEqual({'color': 'red'}, first.data)
+        self.assertEqual(dict(), second.data)
+
 
 class PluginMergeMethodTestCase(common_test.ContextTestCase):
 
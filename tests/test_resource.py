@@ -6,11 +6,13 @@
 # IMPORT STANDARD LIBRARIES
 import os
 import glob
+import weakref
 import tempfile
 import textwrap
 
 # IMPORT WAYS LIBRARIES
 import ways.api
+from ways.parsing import resource
 
 # IMPORT LOCAL LIBRARIES
 from . import common_test
@@ -93,6 +95,50 @@ class AssetCreateTestCase(common_test.ContextTestCase):
 
         self.assertNotEqual(asset, None)
 
+    def test_get_assets(self):
+        '''Create many Asset objects at once, using the same Context.'''
+        contents = textwrap.dedent(
+            '''
+            globals: {}
+            plugins:
+                a_parse_plugin:
+                    hierarchy: some/context
+                    mapping: /jobs/{JOB}/some_kind/of/real_folders
+                    mapping_details:
+                        JOB:
+                            parse:
+                                regex: .+
+            ''')
+
+        self._make_plugin_sheet(contents=contents)
+
+        infos = [
+            '/jobs/some_job/some_kind/of/real_folders',
+            {'JOB': 'another_job'},
+            '/jobs/some_job/some_other_kind/of/real_folders',
+        ]
+        assets = ways.api.get_assets(infos, context='some/context')
+
+        self.assertEqual(
+            ['some_job', 'another_job', None],
+            [asset.get_value('JOB') if asset else None for asset in assets])
+
+    def test_weakref(self):
+        '''Make sure that Asset objects can still be weak-referenced.'''
+        contents = textwrap.dedent(
+            '''
+            plugins:
+                a_parse_plugin:
+                    hierarchy: some/context
+                    mapping: /jobs/{JOB}/some_kind/of/real_folders
+            ''')
+
+        self._make_plugin_sheet(contents=contents)
+
+        asset = ways.api.get_asset({'JOB': 'some_job'}, context='some/context')
+
+        self.assertIs(asset, weakref.ref(asset)())
+
 
 class AssetMethodTestCase(common_test.ContextTestCase):
 
@@ -646,6 +692,71 @@ class AssetMethodTestCase(common_test.ContextTestCase):
         asset = ways.api.get_asset({'JOB': 'something_123'}, context='job')
         self.assertEqual(asset.get_value('JOB_ID'), 123)
 
+    def test_get_value_builtin_leading_zeros(self):
+        '''Cast a value that has leading zeros without reading it as octal.'''
+        contents = textwrap.dedent(
+            r'''
+            plugins:
+                a_parse_plugin:
+                    hierarchy: job
+                    mapping: '/tmp/{JOB}'
+                    mapping_details:
+                        JOB:
+                            mapping: '{JOB_NAME}_{JOB_ID}'
+                        JOB_ID:
+                            before_return:
+                                - int
+            ''')
+
+        self._make_plugin_sheet(contents)
+
+        asset = ways.api.get_asset({'JOB': 'something_0020'}, context='job')
+        self.assertEqual(asset.get_value('JOB_ID'), 20)
+
+    def test_get_value_builtin_non_literal(self):
+        '''Run a builtin on a value that is not a Python literal.'''
+        contents = textwrap.dedent(
+            r'''
+            plugins:
+                a_parse_plugin:
+                    hierarchy: job
+                    mapping: '/tmp/{JOB}'
+                    mapping_details:
+                        JOB:
+                            mapping: '{JOB_NAME}_{JOB_ID}'
+                        JOB_NAME:
+                            before_return:
+                                - len
+            ''')
+
+        self._make_plugin_sheet(contents)
+
+        asset = ways.api.get_asset({'JOB': 'something_123'}, context='job')
+        self.assertEqual(asset.get_value('JOB_NAME'), len('something'))
+
+    def test_get_value_function_unresolvable(self):
+        '''Raise a ValueError if a function could not be found.'''
+        contents = textwrap.dedent(
+            r'''
+            plugins:
+                a_parse_plugin:
+                    hierarchy: job
+                    mapping: '/tmp/{JOB}'
+                    mapping_details:
+                        JOB:
+                            mapping: '{JOB_NAME}_{JOB_ID}'
+                        JOB_ID:
+                            before_return:
+                                - not_a_real_function_name
+            ''')
+
+        self._make_plugin_sheet(contents)
+
+        asset = ways.api.get_asset({'JOB': 'something_123'}, context='job')
+
+        with self.assertRaises(ValueError):
+            asset.get_value('JOB_ID')
+
     def test_get_value_function(self):
         '''Run a function and return its value instead of the original value.'''
         contents = textwrap.dedent(
@@ -744,6 +855,43 @@ class AssetMethodTestCase(common_test.ContextTestCase):
         self.assertEqual(name, scene)
 
 
+class ResourceHelperTestCase(common_test.ContextTestCase):
+
+    '''Test the private functions that Asset objects use to find values.'''
+
+    # pylint: disable=protected-access
+
+    def test_recursive_parents_cyclic(self):
+        '''Get the parents of a token whose mapping details refer to each other.'''
+        contents = textwrap.dedent(
+            r'''
+            plugins:
+                a_parse_plugin:
+                    hierarchy: job
+                    mapping: '/tmp/{JOB}'
+                    mapping_details:
+                        JOB:
+                            mapping: '{JOB_NAME}_{JOB_ID}'
+                        JOB_NAME:
+                            mapping: '{JOB}_{JOB_PREFIX}'
+            ''')
+
+        self._make_plugin_sheet(contents)
+
+        parser = ways.api.get_context('job').get_parser()
+
+        self.assertEqual(['JOB', 'JOB_NAME'], resource._get_recursive_parents('JOB_ID', parser))
+
+    def test_expand_using_parse_types_no_order(self):
+        '''Return the default value if there are no parse types to try.'''
+        pattern = '/tmp/{JOB}'
+        text = '/tmp/foo'
+
+        self.assertEqual(dict(), resource._expand_using_parse_types(pattern, text, order=[]))
+        self.assertEqual(
+            None, resource._expand_using_parse_types(pattern, text, default=None, order=[]))
+
+
 class AssetRegistrationTestCase(common_test.ContextTestCase):
 
     '''Test the different ways that we can register classes for our assets.'''
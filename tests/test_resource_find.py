@@ -8,6 +8,7 @@ import textwrap
 
 # IMPORT WAYS LIBRARIES
 import ways.api
+from ways.parsing import resource
 
 # IMPORT LOCAL LIBRARIES
 from . import common_test
@@ -195,6 +196,45 @@ class FindContextTestCase(common_test.ContextTestCase):
 
         self.assertNotEqual(None, ways.api.get_asset(versioned))
 
+    def test_bytes(self):
+        '''Get a Context/Asset automatically, using a bytes string.'''
+        contents = textwrap.dedent(
+            r'''
+            plugins:
+                version_plugin:
+                    hierarchy: job/versioned_asset
+                    mapping: '/tmp/{JOB}/{SOMETHING}/{ASSET_VERSION}'
+            ''')
+
+        self._make_plugin_sheet(contents)
+
+        asset = ways.api.get_asset(b'/tmp/foo/ttt/8')
+        self.assertNotEqual(None, asset)
+        self.assertEqual(('job', 'versioned_asset'), asset.context.get_hierarchy())
+        self.assertEqual('/tmp/foo/ttt/8', asset.get_str())
+
+    def test_bytes_and_text_dict(self):
+        '''Get a Context/Asset automatically, using a dict of bytes and text.'''
+        contents = textwrap.dedent(
+            r'''
+            plugins:
+                version_plugin:
+                    hierarchy: job/versioned_asset
+                    mapping: '/tmp/{JOB}/{SOMETHING}/{ASSET_VERSION}'
+            ''')
+
+        self._make_plugin_sheet(contents)
+
+        versioned = {
+            'JOB': b'foo',
+            'SOMETHING': u'ttt',
+            'ASSET_VERSION': b'8',
+        }
+
+        asset = ways.api.get_asset(versioned)
+        self.assertNotEqual(None, asset)
+        self.assertEqual('/tmp/foo/ttt/8', asset.get_str())
+
     def test_tie(self):
         '''Raise an error if Ways cannot decide the best Context.'''
         contents = textwrap.dedent(
@@ -296,3 +336,8 @@ class FindContextTestCase(common_test.ContextTestCase):
 
         with self.assertRaises(ValueError):
             ways.api.get_asset(versioned)
+
+    def test_rank_no_contexts(self):
+        '''Get nothing back when there are no Contexts to rank.'''
+        # pylint: disable=protected-access
+        self.assertEqual(None, resource._get_best_context_by_rankings([], '/tmp/foo', dict()))
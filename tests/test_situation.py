@@ -86,6 +86,18 @@ class ContextAliasTestCase(common_test.ContextTestCase):
         with self.assertRaises(ValueError):
             ways.api.register_context_alias('maya_scenes', 'maya/scenes')
 
+    def test_resolve_cyclic_alias(self):
+        '''Stop following aliases once they start to go in a circle.'''
+        ways.api.register_context_alias('scenes', 'maya_scenes')
+        ways.api.register_context_alias('maya_scenes', 'maya/scenes')
+        ways.api.register_context_alias('maya/scenes', 'maya_scenes')
+
+        # The cycle is between 'maya_scenes' and 'maya/scenes' so it
+        # never comes back to 'scenes'. It stops at the first alias
+        # that repeats
+        #
+        self.assertEqual(('maya_scenes', ), ways.api.resolve_alias(('scenes', )))
+
 
 class ContextCreateTestCase(common_test.ContextTestCase):
 
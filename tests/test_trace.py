@@ -172,6 +172,20 @@ class TraceHierarchyTestCase(Common):
 
         self.assertEqual(hierarchies, ways.api.get_all_hierarchies())
 
+    def test_get_all_hierarchies_skip_empty(self):
+        '''Plugins with an empty hierarchy should not be listed.'''
+        hierarchies = {
+            ('foo', ),
+            ('foo', 'bar'),
+        }
+
+        for hierarchy in hierarchies:
+            common_test.create_plugin(hierarchy=hierarchy)
+
+        common_test.create_plugin(hierarchy=tuple())
+
+        self.assertEqual(hierarchies, ways.api.get_all_hierarchies())
+
     def test_get_child_hierarchies(self):
         '''Get all hierarchies that depend on a given hierarchy.'''
         hierarchies = {